@@ -0,0 +1,264 @@
+"""Plus courts chemins entre toutes les paires de sommets, précalculés une fois."""
+
+import heapq
+import json
+from array import array
+from pathlib import Path
+
+from app.algos.dijkstra import UNREACHED
+from app.algos.graph import CSRGraph, as_csr
+from app.utils.counters import record
+
+INF = float("inf")
+# Au-delà de cette densité (E / V²), Floyd-Warshall est préféré à Johnson
+DENSE_THRESHOLD = 0.1
+
+
+class DistanceIndex:
+    """Index des distances et du prochain sommet pour toutes les paires.
+
+    distance() et next_hop() sont des accès directs en O(1), path() suit les
+    prochains sommets en O(longueur du chemin). Sur un graph à poids entiers les
+    lignes de distances sont entières ("q"), les paires inaccessibles y valent
+    UNREACHED ; distance() et to_dict() les rendent comme inf.
+
+    Attributes:
+        names (list[str]): Nom de chaque sommet.
+        index (dict[str, int]): Table inverse nom -> identifiant.
+        distances (list[array]): Ligne des distances depuis chaque sommet ("q" ou "d").
+        next_hops (list[array]): Ligne des prochains sommets (-1 si inaccessible).
+    """
+
+    def __init__(self, names: list[str], distances: list[array], next_hops: list[array]) -> None:
+        self.names = names
+        self.index = {name: vertex for vertex, name in enumerate(names)}
+        self.distances = distances
+        self.next_hops = next_hops
+
+    def distance(self, start: str, end: str) -> float:
+        """Distance minimale de start à end (inf si inaccessible)."""
+        return _finite(self.distances[self.index[start]][self.index[end]])
+
+    def next_hop(self, start: str, end: str) -> str | None:
+        """Premier sommet après start sur un plus court chemin vers end."""
+        hop = self.next_hops[self.index[start]][self.index[end]]
+        return None if hop < 0 else self.names[hop]
+
+    def path(self, start: str, end: str) -> list[str]:
+        """Un plus court chemin de start à end (liste vide si inaccessible)."""
+        vertex, target = self.index[start], self.index[end]
+        if vertex != target and self.next_hops[vertex][target] < 0:
+            return []
+        path = [vertex]
+        while vertex != target:
+            vertex = self.next_hops[vertex][target]
+            path.append(vertex)
+        return [self.names[node] for node in path]
+
+    def to_dict(self) -> dict[str, dict[str, float]]:
+        """Matrice des distances indexée par noms de sommets."""
+        return {
+            name: {target: _finite(distance) for target, distance in zip(self.names, row)}
+            for name, row in zip(self.names, self.distances)
+        }
+
+    def save(self, path: str | Path) -> None:
+        """Écrit l'index : une ligne d'en-tête JSON puis les lignes brutes des tableaux."""
+        with open(path, "wb") as f:
+            typecode = self.distances[0].typecode if self.distances else "d"
+            f.write(json.dumps({"names": self.names, "distances": typecode}).encode("utf-8") + b"\n")
+            for row in self.distances:
+                row.tofile(f)
+            for row in self.next_hops:
+                row.tofile(f)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "DistanceIndex":
+        """Relit un index écrit par save()."""
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            names, typecode = header["names"], header.get("distances", "d")
+            size = len(names)
+            distances = [_read_row(f, typecode, size) for _ in range(size)]
+            next_hops = [_read_row(f, "i", size) for _ in range(size)]
+        return cls(names, distances, next_hops)
+
+
+def _finite(distance):
+    """Distance lue dans une ligne, UNREACHED redevenant inf."""
+    return INF if distance == UNREACHED else distance
+
+
+def _distance_row(row, integer: bool) -> array:
+    """Ligne de distances compacte : entière avec UNREACHED pour inf si les poids sont entiers."""
+    if not integer:
+        return array("d", row)
+    return array("q", (UNREACHED if distance == INF else round(distance) for distance in row))
+
+
+def _read_row(f, typecode: str, size: int) -> array:
+    row = array(typecode)
+    row.fromfile(f, size)
+    return row
+
+
+def all_pairs(graph: CSRGraph | dict[str, dict[str, int]]) -> DistanceIndex:
+    """Plus courts chemins entre toutes les paires de sommets.
+
+    Floyd-Warshall est utilisé sur les graphs denses, Johnson (repondération puis
+    un Dijkstra par sommet) sur les graphs creux.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph
+
+    Raises:
+        ValueError: Si le graph contient un cycle de poids négatif.
+
+    Returns:
+        DistanceIndex: L'index interrogeable des distances
+    """
+    graph = as_csr(graph)
+    if graph.edge_count >= DENSE_THRESHOLD * graph.vertex_count ** 2:
+        return floyd_warshall(graph)
+    return johnson(graph)
+
+
+def floyd_warshall(graph: CSRGraph | dict[str, dict[str, int]]) -> DistanceIndex:
+    """Floyd-Warshall en O(V³), ligne par ligne.
+
+    Les lignes dont la distance vers le sommet intermédiaire k est infinie sont
+    sautées, ce qui accélère beaucoup les graphs peu connectés.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph
+
+    Raises:
+        ValueError: Si le graph contient un cycle de poids négatif.
+
+    Returns:
+        DistanceIndex: L'index interrogeable des distances
+    """
+    graph = as_csr(graph)
+    size = graph.vertex_count
+    distances = [[INF] * size for _ in range(size)]
+    next_hops = [[-1] * size for _ in range(size)]
+    for vertex in range(size):
+        distances[vertex][vertex] = 0
+        next_hops[vertex][vertex] = vertex
+        for neighbor, weight in graph.neighbors(vertex):
+            if weight < distances[vertex][neighbor]:
+                distances[vertex][neighbor] = weight
+                next_hops[vertex][neighbor] = neighbor
+
+    rows, relaxations = 0, 0
+    for k in range(size):
+        row_k = distances[k]
+        for i in range(size):
+            row_i = distances[i]
+            distance_ik = row_i[k]
+            if distance_ik == INF:
+                continue
+            rows += 1
+            hops_i, hop_ik = next_hops[i], next_hops[i][k]
+            for j, distance_kj in enumerate(row_k):
+                if (candidate := distance_ik + distance_kj) < row_i[j]:
+                    row_i[j] = candidate
+                    hops_i[j] = hop_ik
+                    relaxations += 1
+    # Chaque ligne non sautée compare ses size cases
+    record(edges_scanned=graph.edge_count + rows * size, relaxations=relaxations)
+
+    if any(distances[vertex][vertex] < 0 for vertex in range(size)):
+        raise ValueError("Le graph contient un cycle de poids négatif")
+    return DistanceIndex(
+        graph.names,
+        [_distance_row(row, graph.weight_typecode == "q") for row in distances],
+        [array("i", row) for row in next_hops],
+    )
+
+
+def johnson(graph: CSRGraph | dict[str, dict[str, int]]) -> DistanceIndex:
+    """Algorithme de Johnson en O(V × E log V).
+
+    Des potentiels calculés par Bellman Ford depuis un sommet virtuel rendent
+    tous les poids positifs (w'(u, v) = w(u, v) + h(u) - h(v)), puis un Dijkstra
+    par sommet remplit une ligne de l'index.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph
+
+    Raises:
+        ValueError: Si le graph contient un cycle de poids négatif.
+
+    Returns:
+        DistanceIndex: L'index interrogeable des distances
+    """
+    graph = as_csr(graph)
+    potentials = _potentials(graph)
+    sources = graph.edge_sources()
+    reweighted = array("d", (
+        weight + potentials[tail] - potentials[head]
+        for tail, head, weight in zip(sources, graph.targets, graph.weights)
+    ))
+
+    integer = graph.weight_typecode == "q"
+    distances, next_hops = [], []
+    for source in range(graph.vertex_count):
+        row, hops = _dijkstra_row(graph, reweighted, source)
+        for vertex, distance in enumerate(row):
+            if distance != INF:
+                row[vertex] = distance - potentials[source] + potentials[vertex]
+        # Les poids repondérés restent entiers : la distance flottante est exacte
+        distances.append(_distance_row(row, integer))
+        next_hops.append(hops)
+    return DistanceIndex(graph.names, distances, next_hops)
+
+
+def _potentials(graph: CSRGraph) -> list[float]:
+    """Bellman Ford depuis un sommet virtuel relié à tous les sommets par un poids 0."""
+    sources, targets, weights = graph.edge_sources(), graph.targets, graph.weights
+    potentials = [0] * graph.vertex_count
+    relaxations = 0
+    for passes in range(1, graph.vertex_count + 2):
+        changed = False
+        for tail, head, weight in zip(sources, targets, weights):
+            if (candidate := potentials[tail] + weight) < potentials[head]:
+                potentials[head] = candidate
+                changed = True
+                relaxations += 1
+        if not changed:
+            record(edges_scanned=passes * len(targets), relaxations=relaxations)
+            return potentials
+    raise ValueError("Le graph contient un cycle de poids négatif")
+
+
+def _dijkstra_row(graph: CSRGraph, weights: array, source: int) -> tuple[array, array]:
+    """Dijkstra depuis source avec les poids repondérés, et prochains sommets depuis source."""
+    offsets, targets = graph.offsets, graph.targets
+    distances = array("d", [INF]) * graph.vertex_count
+    parents = array("i", [-1]) * graph.vertex_count
+    next_hops = array("i", [-1]) * graph.vertex_count
+    distances[source] = 0
+    next_hops[source] = source
+    queue = [(0.0, source)]
+    settled, scanned, relaxations = 0, 0, 0
+
+    while queue:
+        current_distance, vertex = heapq.heappop(queue)
+        if current_distance > distances[vertex]:
+            continue
+        settled += 1
+        scanned += offsets[vertex + 1] - offsets[vertex]
+        # Les sommets sortent du tas dans l'ordre des distances : le parent est déjà fixé
+        if vertex != source:
+            parent = parents[vertex]
+            next_hops[vertex] = vertex if parent == source else next_hops[parent]
+        for edge in range(offsets[vertex], offsets[vertex + 1]):
+            neighbor = targets[edge]
+            if (distance := current_distance + weights[edge]) < distances[neighbor]:
+                distances[neighbor] = distance
+                parents[neighbor] = vertex
+                heapq.heappush(queue, (distance, neighbor))
+                relaxations += 1
+    record(vertices_settled=settled, edges_scanned=scanned, relaxations=relaxations)
+    return distances, next_hops
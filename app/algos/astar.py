@@ -0,0 +1,172 @@
+"""Recherche A* point à point et ALT (A*, Landmarks, inégalité Triangulaire).
+
+A* est Dijkstra dont la file de priorité est ordonnée par g(v) + h(v), où h(v)
+minore la distance restante de v au sommet d'arrivée : la recherche est guidée
+vers la cible et fixe beaucoup moins de sommets. Avec une heuristique
+cohérente (h(u) <= w(u, v) + h(v)), chaque sommet n'est fixé qu'une fois et le
+chemin trouvé est optimal. Les poids doivent être positifs ou nuls.
+
+ALT précalcule, pour quelques sommets repères L, les distances d(L, v) et
+d(v, L). L'inégalité triangulaire donne alors, pour tout repère :
+    d(v, t) >= d(L, t) - d(L, v)    et    d(v, t) >= d(v, L) - d(t, L)
+"""
+
+import heapq
+from array import array
+from typing import Callable
+
+from app.algos.dijkstra import PathResult, _build_path, _dijkstra_ids
+from app.algos.graph import CSRGraph, as_csr
+from app.utils.counters import record
+
+INF = float("inf")
+# Nombre de repères par défaut : quelques repères suffisent sur les graphs creux
+DEFAULT_LANDMARKS = 8
+
+Heuristic = Callable[[int, int], float]
+
+
+def zero_heuristic(vertex: int, target: int) -> float:
+    """Heuristique nulle : A* se comporte exactement comme Dijkstra."""
+    return 0
+
+
+class LandmarkIndex:
+    """Distances depuis et vers un petit ensemble de sommets repères.
+
+    Attributes:
+        graph (CSRGraph): Le graph indexé.
+        landmarks (list[int]): Les identifiants des repères.
+        from_landmark (list[array]): d(L, v) pour chaque repère L.
+        to_landmark (list[array]): d(v, L) pour chaque repère L (Dijkstra sur le graph inverse).
+    """
+
+    def __init__(self, graph: CSRGraph, count: int = DEFAULT_LANDMARKS) -> None:
+        self.graph = graph
+        self.landmarks: list[int] = []
+        self.from_landmark: list[array] = []
+        self.to_landmark: list[array] = []
+        reverse = graph.reverse()
+
+        # Sélection « le plus loin d'abord » : chaque repère maximise sa distance
+        # aux repères déjà choisis, un sommet encore inaccessible est prioritaire
+        closest = [INF] * graph.vertex_count
+        candidate = 0
+        for _ in range(min(count, graph.vertex_count)):
+            self.landmarks.append(candidate)
+            forward = _dijkstra_ids(graph, candidate)
+            self.from_landmark.append(array("d", forward))
+            self.to_landmark.append(array("d", _dijkstra_ids(reverse, candidate)))
+            for vertex, distance in enumerate(forward):
+                if distance < closest[vertex]:
+                    closest[vertex] = distance
+            for landmark in self.landmarks:
+                closest[landmark] = -1
+            candidate = max(range(graph.vertex_count), key=closest.__getitem__)
+            if closest[candidate] <= 0:
+                break
+
+    def heuristic(self, vertex: int, target: int) -> float:
+        """Meilleur minorant de d(vertex, target) sur l'ensemble des repères.
+
+        Renvoie inf quand un repère prouve que target n'est pas atteignable
+        depuis vertex, ce qui élague le sommet.
+        """
+        bound = 0.0
+        for from_landmark, to_landmark in zip(self.from_landmark, self.to_landmark):
+            # d(v, t) >= d(L, t) - d(L, v)
+            landmark_to_vertex = from_landmark[vertex]
+            if landmark_to_vertex != INF:
+                if (estimate := from_landmark[target] - landmark_to_vertex) > bound:
+                    bound = estimate
+            # d(v, t) >= d(v, L) - d(t, L)
+            target_to_landmark = to_landmark[target]
+            if target_to_landmark != INF:
+                if (estimate := to_landmark[vertex] - target_to_landmark) > bound:
+                    bound = estimate
+        return bound
+
+
+def landmark_index(graph: CSRGraph, count: int = DEFAULT_LANDMARKS) -> LandmarkIndex:
+    """Index des repères d'un graph, calculé une fois puis gardé par le graph pour les requêtes suivantes."""
+    return graph.derived(f"landmarks:{count}", lambda: LandmarkIndex(graph, count))
+
+
+def astar(graph: CSRGraph | dict[str, dict[str, int]], start: str, end: str,
+          heuristic: Heuristic | None = None) -> PathResult:
+    """Recherche A* de start à end.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph (poids positifs ou nuls)
+        start (str): Le sommet de départ
+        end (str): Le sommet d'arrivée
+        heuristic (Heuristic, optional): h(vertex, target) sur les identifiants
+            entiers, doit être cohérente. Defaults to None (heuristique nulle).
+
+    Returns:
+        PathResult: La distance minimale et le chemin, ou une distance infinie et
+            un chemin vide si end n'est pas atteignable.
+    """
+    graph = as_csr(graph)
+    return _astar_ids(graph, graph.id_of(start), graph.id_of(end), heuristic or zero_heuristic)
+
+
+def alt(graph: CSRGraph | dict[str, dict[str, int]], start: str, end: str,
+        landmarks: int = DEFAULT_LANDMARKS) -> PathResult:
+    """A* guidé par les bornes des repères (ALT).
+
+    L'index des repères est calculé à la première requête sur un graph (2 Dijkstra
+    par repère) puis gardé par le graph pour les requêtes suivantes.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph (poids positifs ou nuls)
+        start (str): Le sommet de départ
+        end (str): Le sommet d'arrivée
+        landmarks (int, optional): Nombre de repères. Defaults to DEFAULT_LANDMARKS.
+
+    Returns:
+        PathResult: La distance minimale et le chemin
+    """
+    graph = as_csr(graph)
+    index = landmark_index(graph, landmarks)
+    return _astar_ids(graph, graph.id_of(start), graph.id_of(end), index.heuristic)
+
+
+def _astar_ids(graph: CSRGraph, source: int, target: int, heuristic: Heuristic) -> PathResult:
+    """Cœur de A* sur les identifiants entiers du graph CSR."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = {source: 0}
+    parents: dict[int, int] = {}
+    estimates: dict[int, float] = {}  # h(v), calculée une seule fois par sommet
+    settled = set()
+    queue = [(heuristic(source, target), 0, source)]  # (g + h, g, sommet)
+    scanned = pushes = 0
+
+    while queue:
+        _, current_distance, current_node = heapq.heappop(queue)
+
+        if current_node in settled:
+            continue
+        settled.add(current_node)
+
+        if current_node == target:
+            record(vertices_settled=len(settled), edges_scanned=scanned, heap_pushes=pushes)
+            return PathResult(current_distance, _build_path(graph, parents, source, target))
+
+        first, last = offsets[current_node], offsets[current_node + 1]
+        scanned += last - first
+        for edge in range(first, last):
+            neighbor = targets[edge]
+            distance = current_distance + weights[edge]
+
+            if distance < distances.get(neighbor, INF):
+                if (estimate := estimates.get(neighbor)) is None:
+                    estimate = estimates[neighbor] = heuristic(neighbor, target)
+                if estimate == INF:
+                    continue
+                distances[neighbor] = distance
+                parents[neighbor] = current_node
+                heapq.heappush(queue, (distance + estimate, distance, neighbor))
+                pushes += 1
+    record(vertices_settled=len(settled), edges_scanned=scanned, heap_pushes=pushes)
+    return PathResult(INF, [])
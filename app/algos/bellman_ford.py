@@ -1,11 +1,24 @@
-def bellman_ford(graph: dict[str, dict[str, int]], start: str) -> dict[str, int]:
+from typing import NamedTuple
+
+from app.algos.graph import CSRGraph, as_csr
+from app.utils.counters import record
+
+
+class BellmanFordResult(NamedTuple):
+    """Distances calculées et cycle négatif éventuel (liste vide si aucun)."""
+
+    distances: dict[str, float]
+    cycle: list[str]
+
+
+def bellman_ford(graph: CSRGraph | dict[str, dict[str, int]], start: str) -> dict[str, int]:
     """L'algorithme de Bellman Ford est un algorithme de recherche informée.
 
     Il trouve le plus court chemin entre un sommet de départ et tous les autres sommets du graph.
     Il supporte les arrêtes de poids négatif.
 
     Args:
-        graph (dict[str, dict[str, int]]): Le graph.
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph.
 
         start (str): Le sommet de départ.
 
@@ -13,18 +26,68 @@ def bellman_ford(graph: dict[str, dict[str, int]], start: str) -> dict[str, int]
         dict[str, int]: Les distances minimales depuis le sommet de départ.
 
     """
-    distances = {node: float("inf") for node in graph}
-    distances[start] = 0
-
-    for _ in range(len(graph) - 1):
-        for vertex in graph:
-            for neighbor in graph[vertex]:
-                poids = graph[vertex][neighbor]
-                if (current_weight := distances[vertex] + poids) < distances[neighbor]:
-                    distances[neighbor] = current_weight
-
-    return distances
-def bellman_ford_contains_neg(start: str, graph: dict[str, dict[str, int]]) -> bool:
+    return bellman_ford_cycle(graph, start).distances
+
+
+def bellman_ford_cycle(graph: CSRGraph | dict[str, dict[str, int]], start: str) -> BellmanFordResult:
+    """Bellman Ford avec arrêt anticipé et témoin de cycle négatif en un seul appel.
+
+    Chaque passe relaxe toute la liste d'arêtes du graph CSR. L'algorithme s'arrête
+    dès qu'une passe ne modifie plus aucune distance. Si la V-ième passe modifie
+    encore une distance, le cycle négatif est retrouvé en remontant les prédécesseurs.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph.
+
+        start (str): Le sommet de départ.
+
+    Returns:
+        BellmanFordResult: Les distances et les sommets d'un cycle négatif
+            accessible depuis start (dans l'ordre du cycle).
+
+    """
+    graph = as_csr(graph)
+    sources, targets, weights = graph.edge_sources(), graph.targets, graph.weights
+    vertex_count = graph.vertex_count
+    distances = [float("inf")] * vertex_count
+    parents = [-1] * vertex_count
+    distances[graph.id_of(start)] = 0
+
+    last_relaxed = -1
+    passes = relaxations = 0
+    for _ in range(vertex_count):
+        last_relaxed = -1
+        passes += 1
+        for vertex, neighbor, poids in zip(sources, targets, weights):
+            if (current_weight := distances[vertex] + poids) < distances[neighbor]:
+                distances[neighbor] = current_weight
+                parents[neighbor] = vertex
+                last_relaxed = neighbor
+                relaxations += 1
+        if last_relaxed == -1:
+            break
+    record(passes=passes, edges_scanned=passes * len(targets), relaxations=relaxations)
+
+    cycle = [] if last_relaxed == -1 else _extract_cycle(graph, parents, last_relaxed)
+    return BellmanFordResult(dict(zip(graph.names, distances)), cycle)
+
+
+def _extract_cycle(graph: CSRGraph, parents: list[int], vertex: int) -> list[str]:
+    """Retrouve le cycle négatif à partir d'un sommet encore relâché à la V-ième passe."""
+    # Après V remontées on est forcément sur le cycle
+    for _ in range(graph.vertex_count):
+        vertex = parents[vertex]
+
+    cycle = [vertex]
+    current = parents[vertex]
+    while current != vertex:
+        cycle.append(current)
+        current = parents[current]
+    cycle.reverse()
+    return [graph.names[node] for node in cycle]
+
+
+def bellman_ford_contains_neg(start: str, graph: CSRGraph | dict[str, dict[str, int]]) -> bool:
     """Après l'éxecution de Bellman Ford.
 
     Permet de trouver si le graph contient des cycles de poids négatif.
@@ -32,16 +95,10 @@ def bellman_ford_contains_neg(start: str, graph: dict[str, dict[str, int]]) -> b
     Args:
         start (str): Le sommet de départ
 
-        graph (dict[str, dict[str, int]]): Le graph
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph
 
     Returns:
         bool: vrai, si le graphe contient un cycle négatif.
 
     """
-    distances: dict[str, int] = bellman_ford(graph, start)
-
-    for vertex in graph:
-        for neighbor, poids in graph[vertex].items():
-            if  distances[vertex] + poids < distances[neighbor]:
-                return True
-    return False
+    return bool(bellman_ford_cycle(graph, start).cycle)
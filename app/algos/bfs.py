@@ -1,38 +1,63 @@
+from collections import deque
+from typing import Callable
 
+from app.algos.graph import CSRGraph, as_csr
+from app.algos.union_find import components
+from app.utils.counters import record
 
-def run(graph: dict[str, list], start: str) -> list:
+
+def run(graph: CSRGraph | dict[str, dict[str, int]], start: str,
+        visitor: Callable[[str], None] | None = None) -> list[str]:
     """Le BFS (Breadth-First Search) est un algorithme de recherche non informée qui explore
     le graph en largeur. Il visite tous les sommets d'un niveau avant de passer au suivant.
 
+    La file est une collections.deque (défilement en O(1)).
+
     Args:
-        graph (dict[str, list]): Le graph
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph
         start (str): Le sommet de départ
+        visitor (Callable[[str], None], optional): Appelé sur chaque sommet visité. Defaults to None.
 
     Returns:
-        visited: Le parcours du BFS
+        list[str]: Les sommets dans l'ordre de visite du BFS
     """
-    visited = set()
-    queue = [start]
+    graph = as_csr(graph)
+    offsets, targets, names = graph.offsets, graph.targets, graph.names
+    source = graph.id_of(start)
+
+    seen = bytearray(graph.vertex_count)
+    seen[source] = 1
+    order = []
+    queue = deque([source])
+    scanned = 0
     while queue:
-        node = queue.pop(0)
-        if node not in visited:
-            print(f"Visiting {node}")
-            visited.add(node)
-            queue.extend(graph[node])
-    return visited
+        node = queue.popleft()
+        order.append(node)
+        if visitor is not None:
+            visitor(names[node])
+        first, last = offsets[node], offsets[node + 1]
+        scanned += last - first
+        for neighbor in targets[first:last]:
+            if not seen[neighbor]:
+                seen[neighbor] = 1
+                queue.append(neighbor)
+    record(vertices_visited=len(order), edges_scanned=scanned)
+    return [names[node] for node in order]
 
 
-def run_find_connexe(graph: dict[str, list]) -> list[list[str]]:
-    all_visited = set()
-    components = []
+def run_find_connexe(graph: CSRGraph | dict[str, dict[str, int]]) -> list[list[str]]:
+    """Composantes connexes du graph.
 
-    for node in graph:
-        if node not in all_visited:
-            print(f"\nNouvelle composante depuis {node}")
-            visited = run(graph, node)
-            components.append(list(visited))
-            all_visited.update(visited)
-    return components
+    Un seul passage sur les arêtes alimente un union-find, au lieu de relancer
+    un BFS par composante.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph
+
+    Returns:
+        list[list[str]]: Les composantes connexes
+    """
+    return components(graph)
 
 
 def bfs_boolean(graph: dict[str, list], parent: dict, source: str, sink: str) -> bool:
@@ -48,9 +73,9 @@ def bfs_boolean(graph: dict[str, list], parent: dict, source: str, sink: str) ->
         bool: Renvoi True s'il existe un chemin entre source et sink
     """
     visited = set()
-    queue = [source]
+    queue = deque([source])
     while queue:
-        current_vertex = queue.pop(0)
+        current_vertex = queue.popleft()
         for vertex in graph[current_vertex]:
             if vertex not in visited and graph[current_vertex][vertex] > 0:
                 queue.append(vertex)
@@ -0,0 +1,358 @@
+"""Hiérarchies de contraction (Contraction Hierarchies) pour les requêtes point à point.
+
+Prétraitement : les sommets sont contractés un par un, du moins important au
+plus important. Contracter v le retire du graph ; pour chaque paire de voisins
+u -> v -> w dont le plus court chemin passe par v, un raccourci u -> w de poids
+w(u, v) + w(v, w) est ajouté (sauf si une recherche locale trouve un chemin
+témoin aussi court sans passer par v). L'ordre est choisi par différence
+d'arêtes : raccourcis ajoutés moins arêtes retirées, plus le nombre de voisins
+déjà contractés pour répartir les contractions dans le graph.
+
+Requête : un Dijkstra bidirectionnel qui ne suit que les arêtes montantes (vers
+un sommet de rang supérieur), en avant depuis le départ et en arrière depuis
+l'arrivée. Les deux recherches ne visitent qu'une petite partie du graph. Le
+chemin est ensuite déplié en remplaçant récursivement chaque raccourci par ses
+deux arêtes.
+"""
+
+import heapq
+import json
+from array import array
+from pathlib import Path
+
+from app.algos.dijkstra import PathResult
+from app.algos.graph import CSRGraph, as_csr
+from app.utils.counters import record
+from app.utils.logging.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+INF = float("inf")
+# Nombre maximum de sommets fixés par une recherche de témoin : au-delà, le
+# raccourci est ajouté par prudence (la hiérarchie reste exacte)
+WITNESS_LIMIT = 50
+# Clé de la hiérarchie dans les données dérivées du graph (CSRGraph.derived)
+HIERARCHY_KEY = "contraction_hierarchy"
+
+
+class ContractionHierarchy:
+    """Graphe montant d'une hiérarchie de contraction, prêt pour les requêtes.
+
+    Les arêtes montantes sont stockées au format CSR : up_* pour la recherche
+    avant (u -> w avec rang(w) > rang(u)), down_* pour la recherche arrière
+    (l'arête u -> w est rangée sous w quand rang(u) > rang(w)). middle donne le
+    sommet contourné par chaque raccourci, pour déplier les chemins.
+
+    Attributes:
+        names (list[str]): Nom de chaque sommet.
+        index (dict[str, int]): Table inverse nom -> identifiant.
+        rank (array): Rang de contraction de chaque sommet.
+        up (tuple[array, array, array]): offsets, targets, weights de la recherche avant.
+        down (tuple[array, array, array]): offsets, targets, weights de la recherche arrière.
+        middle (dict[tuple[int, int], int]): Sommet contourné par chaque raccourci (u, w).
+        fingerprint (str): Empreinte du graph d'origine (CSRGraph.fingerprint).
+    """
+
+    def __init__(self, names: list[str], rank: array, up: tuple[array, array, array],
+                 down: tuple[array, array, array], middle: dict[tuple[int, int], int],
+                 fingerprint: str = "") -> None:
+        self.names = names
+        self.index = {name: vertex for vertex, name in enumerate(names)}
+        self.rank = rank
+        self.up = up
+        self.down = down
+        self.middle = middle
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(cls, graph: CSRGraph | dict[str, dict[str, int]],
+              witness_limit: int = WITNESS_LIMIT) -> "ContractionHierarchy":
+        """Contracte tous les sommets du graph (poids positifs ou nuls).
+
+        Args:
+            graph (CSRGraph | dict[str, dict[str, int]]): Le graph
+            witness_limit (int, optional): Sommets fixés au plus par recherche de témoin.
+
+        Raises:
+            ValueError: Si un poids est négatif.
+
+        Returns:
+            ContractionHierarchy: La hiérarchie
+        """
+        graph = as_csr(graph)
+        if graph.weight_range()[0] < 0:
+            raise ValueError("Les hiérarchies de contraction demandent des poids positifs ou nuls")
+        vertex_count = graph.vertex_count
+        # Graphe de travail : arêtes entre sommets non contractés, poids minimal par paire
+        outgoing: list[dict[int, float]] = [{} for _ in range(vertex_count)]
+        incoming: list[dict[int, float]] = [{} for _ in range(vertex_count)]
+        for tail, head, weight in zip(graph.edge_sources(), graph.targets, graph.weights):
+            if tail != head and weight < outgoing[tail].get(head, INF):
+                outgoing[tail][head] = weight
+                incoming[head][tail] = weight
+
+        middle: dict[tuple[int, int], int] = {}
+        contracted_neighbors = [0] * vertex_count
+        rank = array("i", [0]) * vertex_count
+        up_edges: list[list[tuple[int, float]]] = [[] for _ in range(vertex_count)]
+        down_edges: list[list[tuple[int, float]]] = [[] for _ in range(vertex_count)]
+
+        def priority(vertex: int) -> int:
+            shortcuts = _shortcuts(outgoing, incoming, vertex, witness_limit)
+            removed = len(outgoing[vertex]) + len(incoming[vertex])
+            return len(shortcuts) - removed + contracted_neighbors[vertex]
+
+        queue = [(priority(vertex), vertex) for vertex in range(vertex_count)]
+        heapq.heapify(queue)
+        next_rank = 0
+        while queue:
+            _, vertex = heapq.heappop(queue)
+            # Mise à jour paresseuse : la priorité a pu augmenter depuis l'insertion
+            current = priority(vertex)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, vertex))
+                continue
+
+            rank[vertex] = next_rank
+            next_rank += 1
+            # Les voisins restants seront contractés plus tard : arêtes montantes
+            up_edges[vertex] = list(outgoing[vertex].items())
+            down_edges[vertex] = list(incoming[vertex].items())
+
+            for tail, head, weight in _shortcuts(outgoing, incoming, vertex, witness_limit):
+                if weight < outgoing[tail].get(head, INF):
+                    outgoing[tail][head] = weight
+                    incoming[head][tail] = weight
+                    middle[(tail, head)] = vertex
+            for neighbor in outgoing[vertex]:
+                del incoming[neighbor][vertex]
+                contracted_neighbors[neighbor] += 1
+            for neighbor in incoming[vertex]:
+                del outgoing[neighbor][vertex]
+                contracted_neighbors[neighbor] += 1
+            outgoing[vertex] = {}
+            incoming[vertex] = {}
+
+        typecode = graph.weight_typecode
+        return cls(graph.names, rank, _to_csr(up_edges, typecode), _to_csr(down_edges, typecode), middle,
+                   graph.fingerprint())
+
+    @property
+    def shortcut_count(self) -> int:
+        """Nombre de raccourcis de la hiérarchie."""
+        return len(self.middle)
+
+    def query(self, start: str, end: str) -> PathResult:
+        """Plus court chemin de start à end par la recherche bidirectionnelle montante.
+
+        Raises:
+            KeyError: Si un des sommets n'existe pas.
+        """
+        source, target = self.index[start], self.index[end]
+        forward = _upward_search(self.up, source)
+        backward = _upward_search(self.down, target)
+        best, meeting = INF, -1
+        distances_backward = backward[0]
+        for vertex, distance in forward[0].items():
+            if vertex in distances_backward and (total := distance + distances_backward[vertex]) < best:
+                best, meeting = total, vertex
+        record(vertices_settled=len(forward[0]) + len(backward[0]))
+        if meeting < 0:
+            return PathResult(INF, [])
+
+        # Arêtes du départ au sommet de rencontre, puis de la rencontre à l'arrivée
+        edges = []
+        vertex = meeting
+        while vertex != source:
+            parent = forward[1][vertex]
+            edges.append((parent, vertex))
+            vertex = parent
+        edges.reverse()
+        vertex = meeting
+        while vertex != target:
+            child = backward[1][vertex]
+            edges.append((vertex, child))
+            vertex = child
+
+        path = [source]
+        for tail, head in edges:
+            path.extend(self._unpack(tail, head))
+        return PathResult(best, [self.names[vertex] for vertex in path])
+
+    def _unpack(self, tail: int, head: int) -> list[int]:
+        """Sommets d'une arête (sauf tail) après dépliage des raccourcis."""
+        unpacked = []
+        stack = [(tail, head)]
+        while stack:
+            tail, head = stack.pop()
+            if (vertex := self.middle.get((tail, head))) is None:
+                unpacked.append(head)
+            else:
+                # Deuxième moitié empilée d'abord : la première moitié sort en premier
+                stack.append((vertex, head))
+                stack.append((tail, vertex))
+        return unpacked
+
+    def save(self, path: str | Path) -> None:
+        """Écrit la hiérarchie : une ligne d'en-tête JSON puis les tableaux bruts."""
+        header = {
+            "fingerprint": self.fingerprint,
+            "names": self.names,
+            "weights": self.up[2].typecode,
+            "sizes": [len(self.up[1]), len(self.down[1]), len(self.middle)],
+        }
+        shortcuts = array("i")
+        for (tail, head), vertex in self.middle.items():
+            shortcuts.extend((tail, head, vertex))
+        with open(path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            for values in (self.rank, *self.up, *self.down, shortcuts):
+                values.tofile(f)
+
+    @classmethod
+    def load(cls, path: str | Path, graph: CSRGraph | None = None) -> "ContractionHierarchy":
+        """Relit une hiérarchie écrite par save().
+
+        Args:
+            path (str | Path): Le fichier de la hiérarchie
+            graph (CSRGraph, optional): Le graph auquel la hiérarchie doit correspondre.
+
+        Raises:
+            ValueError: Si la hiérarchie a été construite pour un autre graph.
+
+        Returns:
+            ContractionHierarchy: La hiérarchie
+        """
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            fingerprint = header.get("fingerprint", "")
+            if graph is not None and fingerprint != graph.fingerprint():
+                raise ValueError(f"{path} a été construite pour un autre graph")
+            names, typecode = header["names"], header["weights"]
+            up_size, down_size, shortcut_count = header["sizes"]
+            rank = _read(f, "i", len(names))
+            up = (_read(f, "q", len(names) + 1), _read(f, "i", up_size), _read(f, typecode, up_size))
+            down = (_read(f, "q", len(names) + 1), _read(f, "i", down_size), _read(f, typecode, down_size))
+            shortcuts = _read(f, "i", 3 * shortcut_count)
+        middle = {
+            (shortcuts[position], shortcuts[position + 1]): shortcuts[position + 2]
+            for position in range(0, len(shortcuts), 3)
+        }
+        return cls(names, rank, up, down, middle, fingerprint)
+
+
+def _read(f, typecode: str, size: int) -> array:
+    values = array(typecode)
+    values.fromfile(f, size)
+    return values
+
+
+def _shortcuts(outgoing: list[dict[int, float]], incoming: list[dict[int, float]], vertex: int,
+               witness_limit: int) -> list[tuple[int, int, float]]:
+    """Raccourcis nécessaires pour contracter vertex (tail, head, poids)."""
+    shortcuts = []
+    heads = outgoing[vertex]
+    for tail, weight_in in incoming[vertex].items():
+        limit = weight_in + max((weight for head, weight in heads.items() if head != tail), default=-1)
+        if limit < 0:
+            continue
+        witness = _witness_search(outgoing, tail, vertex, limit, witness_limit)
+        for head, weight_out in heads.items():
+            if head != tail and (via := weight_in + weight_out) < witness.get(head, INF):
+                shortcuts.append((tail, head, via))
+    return shortcuts
+
+
+def _witness_search(outgoing: list[dict[int, float]], source: int, excluded: int, limit: float,
+                    witness_limit: int) -> dict[int, float]:
+    """Dijkstra local depuis source sans passer par excluded, borné en distance et en taille."""
+    distances = {source: 0}
+    queue = [(0, source)]
+    settled = 0
+    while queue and settled < witness_limit:
+        distance, vertex = heapq.heappop(queue)
+        if distance > distances[vertex]:
+            continue
+        if distance > limit:
+            break
+        settled += 1
+        for neighbor, weight in outgoing[vertex].items():
+            if neighbor != excluded and (candidate := distance + weight) < distances.get(neighbor, INF):
+                distances[neighbor] = candidate
+                heapq.heappush(queue, (candidate, neighbor))
+    return distances
+
+
+def _to_csr(edges: list[list[tuple[int, float]]], typecode: str) -> tuple[array, array, array]:
+    offsets = array("q", [0]) * (len(edges) + 1)
+    targets = array("i")
+    weights = array(typecode)
+    for vertex, vertex_edges in enumerate(edges):
+        for head, weight in vertex_edges:
+            targets.append(head)
+            weights.append(weight)
+        offsets[vertex + 1] = len(targets)
+    return offsets, targets, weights
+
+
+def _upward_search(upward: tuple[array, array, array], source: int) -> tuple[dict[int, float], dict[int, int]]:
+    """Dijkstra complet sur le graph montant (petit par construction)."""
+    offsets, targets, weights = upward
+    distances = {source: 0}
+    parents: dict[int, int] = {}
+    queue = [(0, source)]
+    while queue:
+        distance, vertex = heapq.heappop(queue)
+        if distance > distances[vertex]:
+            continue
+        for edge in range(offsets[vertex], offsets[vertex + 1]):
+            neighbor = targets[edge]
+            if (candidate := distance + weights[edge]) < distances.get(neighbor, INF):
+                distances[neighbor] = candidate
+                parents[neighbor] = vertex
+                heapq.heappush(queue, (candidate, neighbor))
+    return distances, parents
+
+
+def hierarchy(graph: CSRGraph) -> ContractionHierarchy:
+    """Hiérarchie d'un graph, construite à la première requête puis gardée par le graph."""
+    return graph.derived(HIERARCHY_KEY, lambda: ContractionHierarchy.build(graph))
+
+
+def hierarchy_file(graph: CSRGraph, path: str | Path) -> ContractionHierarchy:
+    """Hiérarchie d'un graph relue depuis path, ou construite puis écrite dans path.
+
+    Un fichier construit pour un autre graph (empreinte différente) est
+    reconstruit et remplacé. La hiérarchie est ensuite gardée par le graph pour
+    les requêtes suivantes.
+    """
+    def load_or_build() -> ContractionHierarchy:
+        if Path(path).exists():
+            try:
+                return ContractionHierarchy.load(path, graph)
+            except ValueError as e:
+                logger.warning(f"{e}, reconstruction")
+        built = ContractionHierarchy.build(graph)
+        built.save(path)
+        logger.debug(f"Contraction hierarchy written to {path}")
+        return built
+
+    return graph.derived(HIERARCHY_KEY, load_or_build)
+
+
+def contraction_hierarchy(graph: CSRGraph | dict[str, dict[str, int]], start: str, end: str) -> PathResult:
+    """Plus court chemin point à point par hiérarchie de contraction.
+
+    Le prétraitement est fait une seule fois par graph (mis en cache) ; chaque
+    requête ne parcourt ensuite que les arêtes montantes depuis les deux extrémités.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph (poids positifs ou nuls)
+        start (str): Le sommet de départ
+        end (str): Le sommet d'arrivée
+
+    Returns:
+        PathResult: La distance minimale et le chemin, ou une distance infinie et
+            un chemin vide si end n'est pas atteignable.
+    """
+    return hierarchy(as_csr(graph)).query(start, end)
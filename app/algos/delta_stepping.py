@@ -0,0 +1,328 @@
+"""Delta-stepping : plus courts chemins depuis une source, par seaux de largeur delta.
+
+Les distances provisoires sont rangées dans des seaux [i·delta, (i + 1)·delta).
+Les arêtes sont séparées en légères (poids <= delta) et lourdes (poids > delta).
+Le plus petit seau non vide est traité par phases : tous ses sommets relâchent
+leurs arêtes légères en un seul lot, ce qui peut remettre des sommets dans le
+même seau ; quand il est vide, les sommets fixés dans ce seau relâchent leurs
+arêtes lourdes (qui ne peuvent pas retomber dans le seau courant).
+
+Chaque phase relâche un lot entier de sommets au lieu d'un sommet à la fois :
+la génération des requêtes (voisin, distance candidate) d'un lot est
+indépendante d'un sommet à l'autre et peut être répartie sur plusieurs
+processus. delta = 1 pour des poids entiers revient à Dijkstra, un delta très
+grand à Bellman-Ford.
+"""
+
+import atexit
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable
+
+from app.algos.graph import CSRGraph, as_csr
+from app.utils.counters import record
+from app.utils.snapshot import from_buffer, snapshot_size, write_into
+
+INF = float("inf")
+# Taille minimale d'un lot pour le répartir sur les processus : en dessous,
+# l'envoi des sommets et le retour des requêtes coûtent plus que le calcul
+PARALLEL_MIN_BATCH = 4096
+
+Requests = dict[int, float]
+
+
+def default_delta(graph: CSRGraph) -> float:
+    """Largeur de seau par défaut : poids maximal divisé par le degré sortant moyen.
+
+    C'est le choix de Meyer et Sanders pour des poids aléatoires : chaque seau
+    reçoit en moyenne assez de sommets pour former des lots, sans relâcher trop
+    souvent une même arête légère.
+    """
+    max_weight = graph.weight_range()[1]
+    if max_weight <= 0:
+        return 1
+    delta = max_weight / max(graph.edge_count / graph.vertex_count, 1)
+    return max(int(delta), 1) if graph.weight_typecode == "q" else delta
+
+
+def split_edges(graph: CSRGraph, delta: float) -> tuple[CSRGraph, array]:
+    """Réordonne chaque liste d'adjacence : arêtes légères d'abord, lourdes ensuite.
+
+    Le résultat est gardé par le graph pour le dernier delta utilisé seulement.
+
+    Args:
+        graph (CSRGraph): Le graph (poids positifs ou nuls)
+        delta (float): La largeur des seaux
+
+    Returns:
+        tuple[CSRGraph, array]: Le graph réordonné et, pour chaque sommet, l'indice
+            de sa première arête lourde.
+    """
+    splits = graph.derived("delta_split", dict)
+    if delta not in splits:
+        splits.clear()
+        splits[delta] = _split_edges(graph, delta)
+    return splits[delta]
+
+
+def _split_edges(graph: CSRGraph, delta: float) -> tuple[CSRGraph, array]:
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    split_targets = array("i")
+    split_weights = array(graph.weight_typecode)
+    heavy_start = array("q", [0]) * graph.vertex_count
+    for vertex in range(graph.vertex_count):
+        first, last = offsets[vertex], offsets[vertex + 1]
+        heavy = []
+        for edge in range(first, last):
+            if weights[edge] <= delta:
+                split_targets.append(targets[edge])
+                split_weights.append(weights[edge])
+            else:
+                heavy.append(edge)
+        heavy_start[vertex] = len(split_targets)
+        split_targets.extend(targets[edge] for edge in heavy)
+        split_weights.extend(weights[edge] for edge in heavy)
+
+    split = CSRGraph(graph.names, array("q", graph.offsets), split_targets, split_weights)
+    split.index = graph.index
+    return split, heavy_start
+
+
+def delta_stepping(graph: CSRGraph | dict[str, dict[str, int]], start: str,
+                   delta: float | None = None, workers: int | None = None) -> dict[str, float]:
+    """Distances minimales depuis start par delta-stepping.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph (poids positifs ou nuls)
+        start (str): Le sommet de départ
+        delta (float, optional): Largeur des seaux. Defaults to None (default_delta).
+        workers (int, optional): Nombre de processus pour relâcher les grands lots ;
+            0, 1 ou None pour tout calculer dans le processus courant. Le pool
+            est gardé pour les requêtes suivantes sur le même graph (shared_pool).
+
+    Raises:
+        ValueError: Si un poids est négatif ou si delta n'est pas strictement positif.
+
+    Returns:
+        dict[str, float]: Les distances minimales depuis le sommet de départ
+    """
+    graph = as_csr(graph)
+    source = graph.id_of(start)
+    if workers and workers > 1:
+        distances = shared_pool(graph, delta, workers).run(source)
+    else:
+        distances = _delta_stepping_ids(graph, source, delta)
+    return dict(zip(graph.names, distances))
+
+
+def _check(graph: CSRGraph, delta: float | None) -> float:
+    """Vérifie les poids et renvoie la largeur de seau à utiliser."""
+    if graph.weight_range()[0] < 0:
+        raise ValueError("Le delta-stepping demande des poids positifs ou nuls")
+    delta = default_delta(graph) if delta is None else delta
+    if delta <= 0:
+        raise ValueError(f"delta doit être strictement positif: {delta}")
+    return delta
+
+
+def _delta_stepping_ids(graph: CSRGraph, source: int, delta: float | None) -> list[float]:
+    """Cœur du delta-stepping sur les identifiants entiers, dans le processus courant."""
+    delta = _check(graph, delta)
+    split, heavy_start = split_edges(graph, delta)
+    distances: list[float] = [INF] * graph.vertex_count
+
+    def generate(batch: list[int], light: bool) -> Requests:
+        return _requests(split.offsets, split.targets, split.weights, heavy_start, distances, batch, light)
+
+    _run_buckets(distances, source, delta, generate)
+    return distances
+
+
+def _requests(offsets, targets, weights, heavy_start, distances, batch, light: bool) -> Requests:
+    """Requêtes de relâchement d'un lot : meilleure distance candidate par voisin.
+
+    Seules les candidates qui améliorent la distance connue sont gardées.
+    """
+    requests: Requests = {}
+    for vertex in batch:
+        distance = distances[vertex]
+        if light:
+            first, last = offsets[vertex], heavy_start[vertex]
+        else:
+            first, last = heavy_start[vertex], offsets[vertex + 1]
+        for edge in range(first, last):
+            neighbor = targets[edge]
+            candidate = distance + weights[edge]
+            if candidate < distances[neighbor] and candidate < requests.get(neighbor, INF):
+                requests[neighbor] = candidate
+    return requests
+
+
+def _run_buckets(distances, source: int, delta: float,
+                 generate: Callable[[list[int], bool], Requests]) -> None:
+    """Boucle des seaux, commune aux modes séquentiel et multi-processus.
+
+    generate(lot, légères) produit les requêtes d'un lot ; elles sont
+    appliquées ici, seul endroit où distances est modifié.
+    """
+    distances[source] = 0
+    buckets: dict[int, list[int]] = {0: [source]}
+    order = [0]  # tas des indices de seaux non vides
+    phases = relaxations = 0
+
+    def relax(requests: Requests) -> None:
+        nonlocal relaxations
+        for vertex, candidate in requests.items():
+            if candidate < distances[vertex]:
+                distances[vertex] = candidate
+                index = int(candidate // delta)
+                if index not in buckets:
+                    buckets[index] = []
+                    heapq.heappush(order, index)
+                buckets[index].append(vertex)
+                relaxations += 1
+
+    while order:
+        index = heapq.heappop(order)
+        settled: set[int] = set()
+        while bucket := buckets.pop(index, None):
+            # Un sommet passé dans un seau inférieur depuis son insertion est périmé
+            batch = [vertex for vertex in set(bucket) if int(distances[vertex] // delta) == index]
+            settled.update(batch)
+            phases += 1
+            relax(generate(batch, True))
+        if settled:
+            relax(generate(list(settled), False))
+    record(phases=phases, relaxations=relaxations)
+
+
+# État de chaque processus du pool, fixé une fois par _init_worker
+_worker_memory: list[shared_memory.SharedMemory] = []
+_worker_state: tuple = ()
+
+
+def _init_worker(graph_name: str, state_name: str, vertex_count: int) -> None:
+    """Attache le graph réordonné et l'état partagé (arêtes lourdes, distances)."""
+    global _worker_memory, _worker_state
+    graph_memory = shared_memory.SharedMemory(name=graph_name)
+    state_memory = shared_memory.SharedMemory(name=state_name)
+    _worker_memory = [graph_memory, state_memory]
+    graph, _ = from_buffer(graph_memory.buf)
+    heavy_start, distances = _state_views(state_memory, vertex_count)
+    _worker_state = (graph.offsets, graph.targets, graph.weights, heavy_start, distances)
+
+
+def _worker_requests(task: tuple[bytes, bool]) -> Requests:
+    batch, light = task
+    return _requests(*_worker_state, array("i", batch), light)
+
+
+def _state_views(memory: shared_memory.SharedMemory, vertex_count: int) -> tuple[memoryview, memoryview]:
+    """Vues 'q' (première arête lourde) et 'd' (distances) sur le bloc d'état partagé."""
+    size = 8 * vertex_count
+    return memory.buf[:size].cast("q"), memory.buf[size:2 * size].cast("d")
+
+
+class DeltaSteppingPool:
+    """Delta-stepping dont les grands lots sont relâchés par un pool de processus.
+
+    Le graph réordonné (arêtes légères puis lourdes) est copié une fois en
+    mémoire partagée au format des snapshots, comme pour ParallelExecutor ; un
+    second bloc partagé contient l'indice de la première arête lourde et les
+    distances. Les processus lisent ces distances sans copie pour filtrer leurs
+    requêtes ; seul le processus principal les écrit, entre deux lots. Un lot
+    de moins de PARALLEL_MIN_BATCH sommets est relâché localement.
+
+    S'utilise comme gestionnaire de contexte pour libérer le pool et la mémoire.
+    """
+
+    def __init__(self, graph: CSRGraph, delta: float | None = None, workers: int | None = None) -> None:
+        self.original = graph
+        self.delta = _check(graph, delta)
+        self.graph, heavy_start = split_edges(graph, self.delta)
+        self.workers = workers or os.cpu_count() or 1
+        vertex_count = graph.vertex_count
+
+        self.graph_memory = shared_memory.SharedMemory(create=True, size=max(snapshot_size(self.graph), 1))
+        write_into(self.graph_memory.buf, self.graph)
+        self.state_memory = shared_memory.SharedMemory(create=True, size=max(16 * vertex_count, 1))
+        self.heavy_start, self.distances = _state_views(self.state_memory, vertex_count)
+        self.heavy_start[:] = heavy_start
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.graph_memory.name, self.state_memory.name, vertex_count),
+        )
+
+    def run(self, source: int) -> list[float]:
+        """Distances minimales depuis l'identifiant source."""
+        self.distances[:] = array("d", [INF]) * self.graph.vertex_count
+        _run_buckets(self.distances, source, self.delta, self._generate)
+        integer = self.graph.weight_typecode == "q"
+        return [int(distance) if integer and distance != INF else distance for distance in self.distances]
+
+    def _generate(self, batch: list[int], light: bool) -> Requests:
+        graph = self.graph
+        if len(batch) < PARALLEL_MIN_BATCH:
+            return _requests(graph.offsets, graph.targets, graph.weights, self.heavy_start,
+                             self.distances, batch, light)
+        size = -(-len(batch) // self.workers)
+        tasks = [(array("i", batch[first:first + size]).tobytes(), light) for first in range(0, len(batch), size)]
+        # Plusieurs processus peuvent proposer le même voisin : on garde le minimum
+        merged: Requests = {}
+        for requests in self.pool.map(_worker_requests, tasks):
+            for vertex, candidate in requests.items():
+                if candidate < merged.get(vertex, INF):
+                    merged[vertex] = candidate
+        return merged
+
+    def close(self) -> None:
+        """Arrête les processus et libère la mémoire partagée."""
+        self.pool.shutdown()
+        # Les vues doivent être relâchées avant de fermer les blocs
+        self.heavy_start.release()
+        self.distances.release()
+        for memory in (self.graph_memory, self.state_memory):
+            memory.close()
+            memory.unlink()
+
+    def __enter__(self) -> "DeltaSteppingPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+# Pool du dernier graph utilisé en mode multi-processus, gardé entre les requêtes
+_shared_pool: DeltaSteppingPool | None = None
+
+
+def shared_pool(graph: CSRGraph, delta: float | None = None, workers: int | None = None) -> DeltaSteppingPool:
+    """Pool réutilisé tant que le graph, delta et le nombre de processus ne changent pas.
+
+    Démarrer les processus et copier le graph en mémoire partagée coûte plus
+    qu'une requête sur un graph moyen : le pool n'est rentable que s'il sert à
+    plusieurs requêtes, ou à une seule requête sur un très grand graph. Un seul
+    pool est gardé ; il est fermé quand un autre graph le remplace, ou à la
+    sortie du programme.
+    """
+    global _shared_pool
+    delta = _check(graph, delta)
+    workers = workers or os.cpu_count() or 1
+    pool = _shared_pool
+    if pool is None or pool.original is not graph or pool.delta != delta or pool.workers != workers:
+        close_shared_pool()
+        pool = _shared_pool = DeltaSteppingPool(graph, delta, workers)
+    return pool
+
+
+@atexit.register
+def close_shared_pool() -> None:
+    """Ferme le pool partagé s'il existe."""
+    global _shared_pool
+    if _shared_pool is not None:
+        _shared_pool.close()
+        _shared_pool = None
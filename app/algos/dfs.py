@@ -1,47 +1,99 @@
+from typing import Callable
 
+from app.algos.graph import CSRGraph, as_csr
+from app.utils.counters import record
 
-def run(graph: dict[str, list], start: str, visited: set = None) -> list:
+
+def run(graph: CSRGraph | dict[str, dict[str, int]], start: str,
+        visitor: Callable[[str], None] | None = None) -> list[str]:
     """Le DFS (Depth-First Search) est un algorithme de recherche non informée qui explore
+    le graph en profondeur.
+
+    Version itérative avec une pile explicite : l'ordre de visite est celui de la
+    version récursive, sans limite de profondeur.
 
     Args:
-        graph (dict[str, list]): Le graph
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph
         start (str): Le sommet de départ
-        visited (set, optional): Les sommets déjà visités. Defaults to None.
+        visitor (Callable[[str], None], optional): Appelé sur chaque sommet visité. Defaults to None.
 
     Returns:
-        visited: Le parcours du DFS
+        list[str]: Les sommets dans l'ordre de visite du DFS
     """
-    if visited is None:
-        visited = set()
-    visited.add(start)
-    print(f"Visiting {start}")
-    for node in graph[start]:
-        if node not in visited:
-            run(graph, node, visited)
-    return visited
-
-def run_cyles(graph: dict[str, list], start: str, visited: set = None, parent: str = None) -> bool:
+    graph = as_csr(graph)
+    offsets, targets, names = graph.offsets, graph.targets, graph.names
+    source = graph.id_of(start)
+
+    visited = bytearray(graph.vertex_count)
+    visited[source] = 1
+    order = [source]
+    if visitor is not None:
+        visitor(names[source])
+    # Chaque entrée de la pile garde la position dans la liste d'adjacence du sommet
+    stack = [(source, offsets[source])]
+    scanned = 0
+    while stack:
+        node, edge = stack[-1]
+        end = offsets[node + 1]
+        while edge < end and visited[targets[edge]]:
+            edge += 1
+        if edge == end:
+            # Liste d'adjacence épuisée : toutes ses arêtes ont été examinées
+            scanned += end - offsets[node]
+            stack.pop()
+            continue
+        stack[-1] = (node, edge + 1)
+        neighbor = targets[edge]
+        visited[neighbor] = 1
+        order.append(neighbor)
+        if visitor is not None:
+            visitor(names[neighbor])
+        stack.append((neighbor, offsets[neighbor]))
+    record(vertices_visited=len(order), edges_scanned=scanned)
+    return [names[node] for node in order]
+
+def run_cyles(graph: CSRGraph | dict[str, dict[str, int]], start: str,
+              visitor: Callable[[str], None] | None = None) -> bool:
     """Version du DFS qui permet de détecter les cycles dans le graph.
 
+    Un voisin déjà visité qui n'est pas le parent du sommet courant ferme un cycle.
+    Version itérative avec une pile explicite.
+
     Args:
-        graph (dict[str, list]): Le graph
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph
         start (str): Le sommet de départ
-        visited (set, optional): Les sommets déjà visités. Defaults to None.
-        parent (str, optional): Le parent du sommet actuel. Defaults to None.
+        visitor (Callable[[str], None], optional): Appelé sur chaque sommet visité. Defaults to None.
 
     Returns:
-        visited: Le parcours du DFS
+        bool: vrai, si un cycle est accessible depuis start
     """
-    if visited is None:
-        visited = set()
-    visited.add(start)
-    print(f"Visiting {start}")
-    for neighbor in graph[start]:
-        if neighbor not in visited:
-            if run_cyles(graph, neighbor, visited, start):
-                return True
+    graph = as_csr(graph)
+    offsets, targets, names = graph.offsets, graph.targets, graph.names
+    source = graph.id_of(start)
+
+    visited = bytearray(graph.vertex_count)
+    visited[source] = 1
+    if visitor is not None:
+        visitor(names[source])
+    # (sommet, parent, position dans la liste d'adjacence)
+    stack = [(source, -1, offsets[source])]
+    visited_count, scanned = 1, 0
+    while stack:
+        node, parent, edge = stack[-1]
+        if edge == offsets[node + 1]:
+            stack.pop()
+            continue
+        stack[-1] = (node, parent, edge + 1)
+        scanned += 1
+        neighbor = targets[edge]
+        if not visited[neighbor]:
+            visited[neighbor] = 1
+            visited_count += 1
+            if visitor is not None:
+                visitor(names[neighbor])
+            stack.append((neighbor, node, offsets[neighbor]))
         elif neighbor != parent:
-            print(f"Cycle detected via {neighbor} (from {start})")
+            record(vertices_visited=visited_count, edges_scanned=scanned)
             return True
+    record(vertices_visited=visited_count, edges_scanned=scanned)
     return False
-
@@ -1,6 +1,3 @@
-
-
-
 """"Pseudo code dijkstra:
 
 Entrée :
@@ -30,32 +27,316 @@ Retourner distance
 
 """
 
+import heapq
+from array import array
+from typing import NamedTuple
+
+from app.algos.graph import CSRGraph, as_csr
+from app.utils.counters import record
+
+
+# Poids maximal pour lequel la file à seaux (Dial) remplace le tas binaire : elle
+# alloue C + 1 seaux par recherche
+DIAL_MAX_WEIGHT = 256
+# Distance des sommets non atteints dans les tableaux entiers (à la place de inf)
+UNREACHED = 2 ** 63 - 1
 
-def dijkstra(graph: [str, str], start: str) -> dict[str, int]:
+
+class PathResult(NamedTuple):
+    """Résultat d'une recherche de plus court chemin point à point."""
+
+    distance: float
+    path: list[str]
+
+
+def dijkstra(graph: CSRGraph | dict[str, dict[str, int]], start: str) -> dict[str, int]:
     """L'algorithme de Dijkstra est un algorithme de recherche informée qui trouve le plus
     court chemin entre un sommet de départ et tous les autres sommets du graph.
 
+    Quand les poids sont des entiers entre 0 et DIAL_MAX_WEIGHT, la file de
+    priorité est une file à seaux (Dial) en O(E + V log C) ; sinon c'est un tas
+    binaire (heapq) en O((V + E) log V).
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph
+        start (str): Le sommet de départ
+
+    Returns:
+        dict[str, int]: Les distances minimales depuis le sommet de départ
+    """
+    graph = as_csr(graph)
+    distances = _dijkstra_ids(graph, graph.id_of(start))
+    return dict(zip(graph.names, distances))
+
+
+def heap_dijkstra(graph: CSRGraph | dict[str, dict[str, int]], start: str) -> dict[str, int]:
+    """Dijkstra avec le tas binaire quels que soient les poids (référence de comparaison).
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph
+        start (str): Le sommet de départ
+
+    Returns:
+        dict[str, int]: Les distances minimales depuis le sommet de départ
+    """
+    graph = as_csr(graph)
+    distances = _heap_dijkstra_ids(graph, graph.id_of(start))
+    return dict(zip(graph.names, distances))
+
+
+def dial_dijkstra(graph: CSRGraph | dict[str, dict[str, int]], start: str) -> dict[str, int]:
+    """Dijkstra avec la file à seaux de Dial, pour des poids entiers positifs ou nuls.
+
+    Les distances possibles des sommets en attente sont toutes dans
+    [d, d + C] où d est la distance courante et C le poids maximal : C + 1
+    seaux utilisés en cercle suffisent. Chaque seau est une simple liste de
+    sommets (pas de tuple à allouer ni à comparer) et les distances sont
+    gardées dans un tableau d'entiers.
+
     Args:
-        graph (dict[str, dict[str, int]]): Le graph
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph
         start (str): Le sommet de départ
 
+    Raises:
+        ValueError: Si un poids n'est pas un entier positif ou nul.
+
     Returns:
         dict[str, int]: Les distances minimales depuis le sommet de départ
     """
-    distances = {node: float('inf') for node in graph}
-    distances[start] = 0
-    queue = [(0, start)]  # (distance, node)
+    graph = as_csr(graph)
+    min_weight, max_weight = graph.weight_range()
+    if graph.weight_typecode != "q" or min_weight < 0:
+        raise ValueError("La file de Dial demande des poids entiers positifs ou nuls")
+    distances = _dial_dijkstra_ids(graph, graph.id_of(start), max_weight)
+    return dict(zip(graph.names, distances))
+
+
+def dial_width(graph: CSRGraph) -> int | None:
+    """Poids maximal du graph si la file de Dial s'applique, None sinon.
+
+    Il faut des poids entiers entre 0 et DIAL_MAX_WEIGHT ; les bornes des poids
+    sont calculées une seule fois par graph (CSRGraph.weight_range).
+    """
+    if graph.weight_typecode != "q" or not graph.edge_count:
+        return None
+    min_weight, max_weight = graph.weight_range()
+    if min_weight < 0 or max_weight > DIAL_MAX_WEIGHT:
+        return None
+    return max_weight
+
+
+def _dijkstra_ids(graph: CSRGraph, source: int) -> list[float]:
+    """Cœur de Dijkstra sur les identifiants entiers, avec la file adaptée aux poids."""
+    max_weight = dial_width(graph)
+    if max_weight is None:
+        return _heap_dijkstra_ids(graph, source)
+    return _dial_dijkstra_ids(graph, source, max_weight)
+
+
+def _heap_dijkstra_ids(graph: CSRGraph, source: int) -> list[float]:
+    """Cœur de Dijkstra sur les identifiants entiers du graph CSR, avec un tas binaire."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = [float('inf')] * graph.vertex_count
+    distances[source] = 0
+    queue = [(0, source)]  # (distance, node)
+    settled = scanned = pushes = 0
 
     while queue:
-        current_distance, current_node = queue.pop(0)
+        current_distance, current_node = heapq.heappop(queue)
 
         if current_distance > distances[current_node]:
             continue
+        first, last = offsets[current_node], offsets[current_node + 1]
+        settled += 1
+        scanned += last - first
 
-        for neighbor, weight in graph[current_node].items():
-            distance = current_distance + weight
+        for edge in range(first, last):
+            neighbor = targets[edge]
+            distance = current_distance + weights[edge]
 
             if distance < distances[neighbor]:
                 distances[neighbor] = distance
-                queue.append((distance, neighbor))
-    return distances
\ No newline at end of file
+                heapq.heappush(queue, (distance, neighbor))
+                pushes += 1
+    record(vertices_settled=settled, edges_scanned=scanned, heap_pushes=pushes)
+    return distances
+
+
+def _dial_dijkstra_ids(graph: CSRGraph, source: int, max_weight: int) -> list[float]:
+    """Cœur de Dijkstra sur les identifiants entiers du graph CSR, avec la file de Dial.
+
+    Les seaux vides ne sont pas parcourus un à un : un petit tas garde la
+    distance de chaque seau non vide (au plus C + 1 entrées), si bien qu'une
+    distance maximale très supérieure au nombre de sommets ne coûte rien.
+
+    Les sommets non atteints valent UNREACHED pendant la recherche, remplacé par
+    inf dans le résultat pour garder le format de _heap_dijkstra_ids.
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = array("q", [UNREACHED]) * graph.vertex_count
+    distances[source] = 0
+    width = max_weight + 1
+    buckets: list[list[int]] = [[] for _ in range(width)]
+    buckets[0].append(source)
+    active = [0]  # distances des seaux non vides
+    settled = scanned = pushes = 0
+
+    while active:
+        current_distance = heapq.heappop(active)
+        bucket = buckets[current_distance % width]
+        # Un poids nul ajoute au seau courant : il est vidé jusqu'au bout
+        while bucket:
+            current_node = bucket.pop()
+            if distances[current_node] != current_distance:
+                continue  # entrée périmée, le sommet a été atteint plus court
+            first, last = offsets[current_node], offsets[current_node + 1]
+            settled += 1
+            scanned += last - first
+
+            for edge in range(first, last):
+                neighbor = targets[edge]
+                distance = current_distance + weights[edge]
+
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    target_bucket = buckets[distance % width]
+                    if not target_bucket and distance != current_distance:
+                        heapq.heappush(active, distance)
+                    target_bucket.append(neighbor)
+                    pushes += 1
+    record(vertices_settled=settled, edges_scanned=scanned, bucket_pushes=pushes)
+    return [float('inf') if distance == UNREACHED else distance for distance in distances]
+
+
+def dijkstra_path(graph: CSRGraph | dict[str, dict[str, int]], start: str, end: str) -> PathResult:
+    """Version point à point de Dijkstra.
+
+    La recherche s'arrête dès que le sommet d'arrivée est fixé (sorti du tas),
+    le chemin est ensuite reconstruit à partir de la table des prédécesseurs.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph
+        start (str): Le sommet de départ
+        end (str): Le sommet d'arrivée
+
+    Returns:
+        PathResult: La distance minimale et le chemin, ou une distance infinie et
+            un chemin vide si end n'est pas atteignable.
+    """
+    graph = as_csr(graph)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    source, target = graph.id_of(start), graph.id_of(end)
+
+    distances = {source: 0}
+    parents: dict[int, int] = {}
+    settled = set()
+    queue = [(0, source)]
+    scanned = pushes = 0
+
+    while queue:
+        current_distance, current_node = heapq.heappop(queue)
+
+        if current_node in settled:
+            continue
+        settled.add(current_node)
+
+        if current_node == target:
+            record(vertices_settled=len(settled), edges_scanned=scanned, heap_pushes=pushes)
+            return PathResult(current_distance, _build_path(graph, parents, source, target))
+
+        first, last = offsets[current_node], offsets[current_node + 1]
+        scanned += last - first
+        for edge in range(first, last):
+            neighbor = targets[edge]
+            distance = current_distance + weights[edge]
+
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                parents[neighbor] = current_node
+                heapq.heappush(queue, (distance, neighbor))
+                pushes += 1
+    record(vertices_settled=len(settled), edges_scanned=scanned, heap_pushes=pushes)
+    return PathResult(float('inf'), [])
+
+
+def bidirectional_dijkstra(graph: CSRGraph | dict[str, dict[str, int]], start: str, end: str) -> PathResult:
+    """Dijkstra bidirectionnel point à point.
+
+    Une recherche avance depuis start sur le graph, l'autre recule depuis end sur
+    le graph inverse (index d'adjacence inverse construit une fois et gardé par le
+    graph CSR). À chaque étape on avance la recherche dont la file a la plus petite
+    tête. Chaque arête qui relie les deux recherches propose un chemin ; on s'arrête
+    quand la somme des deux têtes de file dépasse le meilleur chemin proposé. Sur
+    un graph routier, chaque recherche explore un rayon moitié moindre.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph (poids positifs ou nuls)
+        start (str): Le sommet de départ
+        end (str): Le sommet d'arrivée
+
+    Returns:
+        PathResult: La distance minimale et le chemin, ou une distance infinie et
+            un chemin vide si end n'est pas atteignable.
+    """
+    graph = as_csr(graph)
+    source, target = graph.id_of(start), graph.id_of(end)
+    if source == target:
+        return PathResult(0, [start])
+
+    reverse = graph.reverse()
+    # Index 0 : recherche avant sur graph, index 1 : recherche arrière sur reverse
+    sides = (graph, reverse)
+    distances: tuple[dict[int, float], dict[int, float]] = ({source: 0}, {target: 0})
+    parents: tuple[dict[int, int], dict[int, int]] = ({}, {})
+    settled: tuple[set[int], set[int]] = (set(), set())
+    queues = ([(0, source)], [(0, target)])
+    best, meeting = float('inf'), -1
+    scanned = pushes = 0
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        current_distance, current_node = heapq.heappop(queues[side])
+        if current_node in settled[side]:
+            continue
+        settled[side].add(current_node)
+
+        other_distances = distances[1 - side]
+        offsets, targets, weights = sides[side].offsets, sides[side].targets, sides[side].weights
+        side_distances, side_parents, queue = distances[side], parents[side], queues[side]
+        first, last = offsets[current_node], offsets[current_node + 1]
+        scanned += last - first
+        for edge in range(first, last):
+            neighbor = targets[edge]
+            distance = current_distance + weights[edge]
+
+            if distance < side_distances.get(neighbor, float('inf')):
+                side_distances[neighbor] = distance
+                side_parents[neighbor] = current_node
+                heapq.heappush(queue, (distance, neighbor))
+                pushes += 1
+            # L'arête relie les deux recherches : chemin candidat
+            if neighbor in other_distances and (total := distance + other_distances[neighbor]) < best:
+                best, meeting = total, neighbor
+
+    record(vertices_settled=len(settled[0]) + len(settled[1]), edges_scanned=scanned, heap_pushes=pushes)
+    if meeting < 0:
+        return PathResult(float('inf'), [])
+
+    # Début du chemin par les parents avant, fin par les parents arrière (vers end)
+    path = _build_path(graph, parents[0], source, meeting)
+    vertex = meeting
+    while vertex != target:
+        vertex = parents[1][vertex]
+        path.append(graph.names[vertex])
+    return PathResult(best, path)
+
+
+def _build_path(graph: CSRGraph, parents: dict[int, int], source: int, target: int) -> list[str]:
+    """Remonte la table des prédécesseurs depuis target jusqu'à source."""
+    path = [target]
+    while path[-1] != source:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return [graph.names[vertex] for vertex in path]
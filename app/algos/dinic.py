@@ -0,0 +1,105 @@
+from collections import deque
+
+from app.algos.graph import CSRGraph
+from app.algos.residual import FlowResult, ResidualGraph, shared_residual
+from app.utils.counters import record
+
+
+def dinic(graph: CSRGraph | dict[str, dict[str, int]], source: str, dest: str) -> FlowResult:
+    """L'algorithme de Dinic calcule le flot maximum par phases.
+
+    À chaque phase, un BFS construit le graph de niveaux depuis la source, puis un
+    DFS itératif sature un flot bloquant en ne suivant que les arêtes qui montent
+    d'un niveau. Complexité en O(V² × E), O(E × √V) sur les réseaux bipartis unitaires.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph des capacités
+        source (str): La source
+        dest (str): Le puits
+
+    Returns:
+        FlowResult: Le flot maximum, le flot par arête et la coupe minimale
+    """
+    residual = shared_residual(graph)
+    source_id, dest_id = residual.graph.id_of(source), residual.graph.id_of(dest)
+    return residual.result(_dinic(residual, source_id, dest_id), source_id)
+
+
+def _dinic(residual: ResidualGraph, source: int, sink: int):
+    """Cœur de Dinic sur le graph résiduel, renvoie le flot ajouté."""
+    flot_maximum = 0
+    if source == sink:
+        return flot_maximum
+
+    phases = 0
+    while (level := _levels(residual, source, sink)) is not None:
+        flot_maximum += _blocking_flow(residual, level, source, sink)
+        phases += 1
+    record(phases=phases)
+    return flot_maximum
+
+
+def _levels(residual: ResidualGraph, source: int, sink: int) -> list[int] | None:
+    """BFS depuis la source sur les arêtes non saturées.
+
+    Returns:
+        list[int] | None: Le niveau de chaque sommet (-1 si non atteint), ou None
+            si le puits n'est plus atteignable.
+    """
+    offsets, edges, heads, capacity = residual.offsets, residual.edges, residual.heads, residual.capacity
+    level = [-1] * residual.vertex_count
+    level[source] = 0
+    queue = deque([source])
+    while queue:
+        vertex = queue.popleft()
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            edge = edges[position]
+            neighbor = heads[edge]
+            if capacity[edge] > 0 and level[neighbor] < 0:
+                level[neighbor] = level[vertex] + 1
+                queue.append(neighbor)
+    return level if level[sink] >= 0 else None
+
+
+def _blocking_flow(residual: ResidualGraph, level: list[int], source: int, sink: int):
+    """Sature le graph de niveaux avec des chemins augmentants trouvés par DFS itératif."""
+    offsets, edges, heads, capacity = residual.offsets, residual.edges, residual.heads, residual.capacity
+    current = list(offsets[:-1])  # prochaine arête à essayer pour chaque sommet
+    total = 0
+    paths = 0
+    path: list[int] = []
+    vertex = source
+
+    while True:
+        if vertex == sink:
+            total += residual.augment(path)
+            paths += 1
+            # On repart de la queue de la première arête saturée
+            saturated = next(i for i, edge in enumerate(path) if capacity[edge] == 0)
+            vertex = heads[path[saturated] ^ 1]
+            del path[saturated:]
+            continue
+
+        end = offsets[vertex + 1]
+        position = current[vertex]
+        while position < end:
+            edge = edges[position]
+            if capacity[edge] > 0 and level[heads[edge]] == level[vertex] + 1:
+                break
+            position += 1
+        current[vertex] = position
+
+        if position < end:
+            edge = edges[position]
+            path.append(edge)
+            vertex = heads[edge]
+            continue
+
+        # Impasse : le sommet est retiré du graph de niveaux
+        if vertex == source:
+            record(augmenting_paths=paths)
+            return total
+        level[vertex] = -1
+        edge = path.pop()
+        vertex = heads[edge ^ 1]
+        current[vertex] += 1
@@ -1,23 +1,53 @@
-from app.algos.bfs import bfs_boolean
+from collections import deque
 
+from app.algos.graph import CSRGraph
+from app.algos.residual import FlowResult, ResidualGraph, shared_residual
+from app.utils.counters import record
 
-def edmonds_karp(graph: dict[str, list], source: str, dest: str):
-    parents = {sommet: None for sommet in graph}
+
+def edmonds_karp(graph: CSRGraph | dict[str, dict[str, int]], source: str, dest: str) -> FlowResult:
+    """Edmonds-Karp : Ford-Fulkerson où le chemin augmentant est le plus court, trouvé par BFS.
+
+    Le calcul se fait sur le graph résiduel gardé par le graph, le graph d'entrée n'est pas modifié.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph des capacités
+        source (str): La source
+        dest (str): Le puits
+
+    Returns:
+        FlowResult: Le flot maximum, le flot par arête et la coupe minimale
+    """
+    residual = shared_residual(graph)
+    source_id, dest_id = residual.graph.id_of(source), residual.graph.id_of(dest)
     flot_maximum = 0
+    paths = 0
+
+    while (path := bfs_path(residual, source_id, dest_id)) is not None:
+        flot_maximum += residual.augment(path)
+        paths += 1
+    record(augmenting_paths=paths)
+    return residual.result(flot_maximum, source_id)
+
 
-    while bfs_boolean(graph=graph, source=source, sink=dest, parent=parents):
-        flot_courant = float('inf')
-
-        vertex = dest
-        while vertex != source:
-            flot_courant = min(flot_courant, graph[parents[vertex]][vertex])
-            vertex = parents[vertex]
-        flot_maximum += flot_courant
-
-        vertex = dest
-        while vertex != source:
-            child_vertex = parents[vertex]
-            graph[child_vertex][vertex] -= flot_courant
-            graph[vertex][child_vertex] += flot_courant
-            vertex = parents[vertex]
-    return flot_maximum
+def bfs_path(residual: ResidualGraph, source: int, sink: int) -> list[int] | None:
+    """Plus court chemin augmentant (liste d'arêtes résiduelles) trouvé par BFS."""
+    offsets, edges, heads, capacity = residual.offsets, residual.edges, residual.heads, residual.capacity
+    if source == sink:
+        return None
+    parent_edge = [-1] * residual.vertex_count
+    seen = bytearray(residual.vertex_count)
+    seen[source] = 1
+    queue = deque([source])
+    while queue:
+        vertex = queue.popleft()
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            edge = edges[position]
+            neighbor = heads[edge]
+            if capacity[edge] > 0 and not seen[neighbor]:
+                seen[neighbor] = 1
+                parent_edge[neighbor] = edge
+                if neighbor == sink:
+                    return residual.path_to(parent_edge, source, sink)
+                queue.append(neighbor)
+    return None
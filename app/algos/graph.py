@@ -0,0 +1,261 @@
+"""Représentation compacte CSR (Compressed Sparse Row) des graphes pondérés."""
+
+import hashlib
+from array import array
+from typing import Any, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class CSRGraph:
+    """Graphe orienté pondéré stocké au format CSR.
+
+    Les sommets sont internés en identifiants entiers 0..V-1. Les voisins du
+    sommet u sont targets[offsets[u]:offsets[u + 1]] avec les poids
+    correspondants dans weights.
+
+    Attributes:
+        names (list[str]): Nom de chaque sommet, indexé par identifiant.
+        index (dict[str, int]): Table inverse nom -> identifiant.
+        offsets (array): V + 1 bornes des listes d'adjacence.
+        targets (array): Identifiant du sommet d'arrivée de chaque arête.
+        weights (array): Poids de chaque arête ('q' si entiers, 'd' sinon).
+    """
+
+    __slots__ = ("names", "index", "offsets", "targets", "weights", "_sources", "_fingerprint", "_reverse",
+                 "_weight_range", "_derived")
+
+    def __init__(self, names: list[str], offsets: array, targets: array, weights: array) -> None:
+        self.names = names
+        self.index = {name: vertex for vertex, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._sources: array | None = None
+        self._fingerprint: str | None = None
+        self._reverse: CSRGraph | None = None
+        self._weight_range: tuple[float, float] | None = None
+        self._derived: dict[str, Any] = {}
+
+    @classmethod
+    def from_dict(cls, graph: dict[str, dict[str, int]]) -> "CSRGraph":
+        """Construit le graphe CSR à partir du dictionnaire de source.json.
+
+        Les sommets qui n'apparaissent que comme voisins sont aussi internés.
+
+        Args:
+            graph (dict[str, dict[str, int]]): Le graph
+
+        Returns:
+            CSRGraph: Le graph compact
+        """
+        # Les sommets du dictionnaire sont internés en premier, dans l'ordre,
+        # pour que les lignes CSR suivent l'ordre des identifiants
+        index = {vertex: position for position, vertex in enumerate(graph)}
+        for neighbors in graph.values():
+            for neighbor in neighbors:
+                index.setdefault(neighbor, len(index))
+
+        integer_weights = all(
+            isinstance(weight, int) for neighbors in graph.values() for weight in neighbors.values()
+        )
+        offsets = array("q", [0]) * (len(index) + 1)
+        targets = array("i")
+        weights = array("q" if integer_weights else "d")
+
+        for vertex, neighbors in enumerate(graph.values()):
+            targets.extend(index[neighbor] for neighbor in neighbors)
+            weights.extend(neighbors.values())
+            offsets[vertex + 1] = len(targets)
+        for vertex in range(len(graph) + 1, len(index) + 1):
+            offsets[vertex] = len(targets)
+
+        return cls(list(index), offsets, targets, weights)
+
+    @property
+    def vertex_count(self) -> int:
+        """Nombre de sommets."""
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        """Nombre d'arêtes."""
+        return len(self.targets)
+
+    @property
+    def weight_typecode(self) -> str:
+        """Type des poids ('q' entiers, 'd' flottants), aussi pour des vues memoryview."""
+        return _typecode(self.weights)
+
+    def weight_range(self) -> tuple[float, float]:
+        """Poids minimal et maximal des arêtes ((0, 0) sans arête), calculés une seule fois."""
+        if self._weight_range is None:
+            weights = self.weights
+            self._weight_range = (min(weights, default=0), max(weights, default=0))
+        return self._weight_range
+
+    def derived(self, key: str, build: Callable[[], T]) -> T:
+        """Donnée dérivée du graph (index, prétraitement), construite une seule fois.
+
+        Elle est gardée par le graph lui-même et disparaît avec lui, sans cache
+        global qui retiendrait les graphs déjà remplacés.
+
+        Args:
+            key (str): Nom de la donnée (un par algorithme)
+            build (Callable[[], T]): Construit la donnée au premier appel
+
+        Returns:
+            T: La donnée
+        """
+        if key not in self._derived:
+            self._derived[key] = build()
+        return self._derived[key]
+
+    def id_of(self, name: str) -> int:
+        """Identifiant entier d'un sommet.
+
+        Raises:
+            KeyError: Si le sommet n'existe pas dans le graph.
+        """
+        return self.index[name]
+
+    def neighbors(self, vertex: int) -> Iterator[tuple[int, int]]:
+        """Itère sur les couples (voisin, poids) d'un sommet."""
+        start, end = self.offsets[vertex], self.offsets[vertex + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def edge_sources(self) -> array:
+        """Identifiant du sommet de départ de chaque arête (liste d'arêtes à plat).
+
+        Le tableau est calculé une seule fois puis réutilisé.
+        """
+        if self._sources is None:
+            sources = array("i")
+            offsets = self.offsets
+            for vertex in range(self.vertex_count):
+                sources.extend([vertex] * (offsets[vertex + 1] - offsets[vertex]))
+            self._sources = sources
+        return self._sources
+
+    def reverse(self) -> "CSRGraph":
+        """Graph inverse (chaque arête u -> v devient v -> u), pour les recherches arrière.
+
+        Il est construit une seule fois par tri par dénombrement des arêtes selon
+        leur sommet d'arrivée, puis réutilisé.
+        """
+        if self._reverse is None:
+            vertex_count, edge_count = self.vertex_count, self.edge_count
+            offsets = array("q", [0]) * (vertex_count + 1)
+            for target in self.targets:
+                offsets[target + 1] += 1
+            for vertex in range(vertex_count):
+                offsets[vertex + 1] += offsets[vertex]
+
+            position = offsets[:-1]
+            targets = array("i", bytes(4 * edge_count))
+            weights = array(self.weight_typecode, bytes(array(self.weight_typecode).itemsize * edge_count))
+            for source, target, weight in zip(self.edge_sources(), self.targets, self.weights):
+                slot = position[target]
+                targets[slot] = source
+                weights[slot] = weight
+                position[target] = slot + 1
+
+            reverse = CSRGraph(self.names, offsets, targets, weights)
+            reverse.index = self.index
+            reverse._reverse = self
+            self._reverse = reverse
+        return self._reverse
+
+    def fingerprint(self) -> str:
+        """Empreinte du contenu du graph (noms, structure et poids).
+
+        Le graph CSR n'est jamais modifié en place : l'empreinte est calculée une
+        seule fois, un graph modifié doit être reconstruit.
+        """
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update("\0".join(self.names).encode("utf-8"))
+            for values in (self.offsets, self.targets, self.weights):
+                digest.update(_typecode(values).encode("ascii"))
+                digest.update(values.tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def to_dict(self) -> dict[str, dict[str, int]]:
+        """Reconstruit le dictionnaire d'adjacence au format de source.json."""
+        names = self.names
+        return {
+            names[vertex]: {names[target]: weight for target, weight in self.neighbors(vertex)}
+            for vertex in range(self.vertex_count)
+        }
+
+    def __repr__(self) -> str:
+        return f"CSRGraph(vertices={self.vertex_count}, edges={self.edge_count})"
+
+
+def _typecode(values: array | memoryview) -> str:
+    """Typecode d'un tableau array ou format d'une vue memoryview (instantané mmap)."""
+    return values.typecode if isinstance(values, array) else values.format
+
+
+class CSRBuilder:
+    """Construit un CSRGraph arête par arête, sans passer par le dictionnaire complet.
+
+    Les arêtes sont accumulées dans des tableaux compacts puis regroupées par
+    sommet de départ (tri par dénombrement stable) au moment de build().
+    """
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.index: dict[str, int] = {}
+        self.sources = array("i")
+        self.targets = array("i")
+        self.weights = array("q")
+        self._sorted = True  # vrai tant que les arêtes arrivent groupées par départ
+
+    def add_vertex(self, name: str) -> int:
+        """Interne un sommet s'il est nouveau et renvoie son identifiant."""
+        if (vertex := self.index.get(name)) is None:
+            vertex = self.index[name] = len(self.names)
+            self.names.append(name)
+        return vertex
+
+    def add_edge(self, tail: str, head: str, weight: float) -> None:
+        """Ajoute l'arête tail -> head de poids weight."""
+        source, target = self.add_vertex(tail), self.add_vertex(head)
+        if self.sources and source < self.sources[-1]:
+            self._sorted = False
+        if not isinstance(weight, int) and self.weights.typecode == "q":
+            self.weights = array("d", self.weights)
+        self.sources.append(source)
+        self.targets.append(target)
+        self.weights.append(weight)
+
+    def build(self) -> CSRGraph:
+        """Construit le graph CSR à partir des arêtes accumulées."""
+        vertex_count, edge_count = len(self.names), len(self.targets)
+        offsets = array("q", [0]) * (vertex_count + 1)
+        for source in self.sources:
+            offsets[source + 1] += 1
+        for vertex in range(vertex_count):
+            offsets[vertex + 1] += offsets[vertex]
+
+        if self._sorted:
+            return CSRGraph(self.names, offsets, self.targets, self.weights)
+
+        position = offsets[:-1]
+        targets = array("i", bytes(4 * edge_count))
+        weights = array(self.weights.typecode, bytes(self.weights.itemsize * edge_count))
+        for source, target, weight in zip(self.sources, self.targets, self.weights):
+            slot = position[source]
+            targets[slot] = target
+            weights[slot] = weight
+            position[source] = slot + 1
+        return CSRGraph(self.names, offsets, targets, weights)
+
+
+def as_csr(graph: "CSRGraph | dict[str, dict[str, int]]") -> CSRGraph:
+    """Renvoie le graph au format CSR, en le convertissant si nécessaire."""
+    if isinstance(graph, CSRGraph):
+        return graph
+    return CSRGraph.from_dict(graph)
@@ -0,0 +1,131 @@
+from array import array
+
+from app.algos.ek import bfs_path
+from app.algos.graph import CSRGraph
+from app.algos.residual import FlowResult, ResidualGraph
+
+
+class IncrementalMaxFlow:
+    """Flot maximum entre une source et un puits fixes, réparé après des changements de capacités.
+
+    Le flot est calculé une première fois par Edmonds-Karp sur le graph résiduel.
+    Ensuite, update() applique un lot de variations de capacités en repartant du
+    flot précédent au lieu de recommencer depuis zéro :
+
+    - une hausse de capacité (ou une baisse qui reste au-dessus du flot courant)
+      ne modifie que la capacité résiduelle de l'arête ;
+    - une baisse sous le flot courant retire l'excédent de l'arête (u, v), qui est
+      d'abord redirigé de u vers v par d'autres chemins, puis sinon renvoyé de u
+      vers la source et du puits vers v ;
+    - enfin, de nouveaux chemins augmentants sont cherchés depuis la source.
+
+    Le graph d'entrée n'est pas modifié, les capacités courantes sont gardées à part.
+
+    Attributes:
+        residual (ResidualGraph): Le graph résiduel portant le flot courant.
+        capacities (array): Capacité courante de chaque arête d'origine.
+        value: Valeur du flot maximum courant.
+    """
+
+    def __init__(self, graph: CSRGraph | dict[str, dict[str, int]], source: str, dest: str) -> None:
+        self.residual = ResidualGraph(graph)
+        self.source = self.residual.graph.id_of(source)
+        self.sink = self.residual.graph.id_of(dest)
+        self.capacities = array(self.residual.graph.weight_typecode, self.residual.graph.weights)
+        self.value = 0
+        self._augment_to_sink()
+
+    def result(self) -> FlowResult:
+        """Le flot maximum courant, le flot par arête et la coupe minimale."""
+        return self.residual.result(self.value, self.source)
+
+    def update(self, deltas: dict[tuple[str, str], int]) -> FlowResult:
+        """Applique un lot de variations de capacités et répare le flot.
+
+        Args:
+            deltas (dict[tuple[str, str], int]): Variation de capacité par arête (u, v).
+
+        Raises:
+            KeyError: Si une arête n'existe pas dans le graph.
+            ValueError: Si une capacité devient négative.
+
+        Returns:
+            FlowResult: Le nouveau flot maximum
+        """
+        # Toutes les variations sont vérifiées avant d'en appliquer une seule
+        changes = []
+        for (tail, head), delta in deltas.items():
+            edge = self._edge_index(tail, head)
+            new_capacity = self.capacities[edge] + delta
+            if new_capacity < 0:
+                raise ValueError(f"Capacité négative sur l'arête ({tail}, {head}): {new_capacity}")
+            changes.append((tail, head, edge, new_capacity))
+
+        capacity = self.residual.capacity
+        repaired = True
+        for tail, head, edge, new_capacity in changes:
+            self.capacities[edge] = new_capacity
+            if not repaired:
+                continue  # le flot sera recalculé, seules les capacités comptent
+
+            flot = capacity[2 * edge + 1]
+            if new_capacity >= flot:
+                capacity[2 * edge] = new_capacity - flot
+                continue
+
+            # Le flot dépasse la nouvelle capacité : on retire l'excédent de l'arête
+            capacity[2 * edge] = 0
+            capacity[2 * edge + 1] = new_capacity
+            repaired = self._cancel_overflow(self.residual.graph.id_of(tail), self.residual.graph.id_of(head),
+                                             flot - new_capacity)
+
+        if repaired:
+            self._augment_to_sink()
+        else:
+            self._recompute()
+        return self.result()
+
+    def _cancel_overflow(self, tail: int, head: int, overflow) -> bool:
+        """Rééquilibre l'excédent laissé en tail et le manque laissé en head.
+
+        Returns:
+            bool: Faux si l'excédent n'a pas pu être entièrement résorbé.
+        """
+        remaining = overflow - self._push(tail, head, overflow)
+        if not remaining:
+            return True
+        if tail != self.source and self._push(tail, self.source, remaining) != remaining:
+            return False
+        if head != self.sink and self._push(self.sink, head, remaining) != remaining:
+            return False
+        self.value -= remaining
+        return True
+
+    def _push(self, start: int, end: int, limit):
+        """Pousse au plus limit unités de start vers end par des chemins augmentants."""
+        pushed = 0
+        while pushed < limit and (path := bfs_path(self.residual, start, end)) is not None:
+            pushed += self.residual.augment(path, limit - pushed)
+        return pushed
+
+    def _augment_to_sink(self) -> None:
+        """Augmente le flot courant jusqu'à ce qu'il soit maximum."""
+        while (path := bfs_path(self.residual, self.source, self.sink)) is not None:
+            self.value += self.residual.augment(path)
+
+    def _recompute(self) -> None:
+        """Recalcule le flot depuis zéro avec les capacités courantes."""
+        empty = bytes(len(self.capacities) * self.capacities.itemsize)
+        self.residual.capacity[0::2] = self.capacities
+        self.residual.capacity[1::2] = array(self.capacities.typecode, empty)
+        self.value = 0
+        self._augment_to_sink()
+
+    def _edge_index(self, tail: str, head: str) -> int:
+        """Position CSR de l'arête (tail, head) dans le graph d'origine."""
+        graph = self.residual.graph
+        vertex, target = graph.id_of(tail), graph.id_of(head)
+        for edge in range(graph.offsets[vertex], graph.offsets[vertex + 1]):
+            if graph.targets[edge] == target:
+                return edge
+        raise KeyError(f"Arête inexistante: ({tail}, {head})")
@@ -0,0 +1,149 @@
+from collections import deque
+
+from app.algos.graph import CSRGraph
+from app.algos.residual import FlowResult, ResidualGraph, shared_residual
+from app.utils.counters import record
+
+
+def push_relabel(graph: CSRGraph | dict[str, dict[str, int]], source: str, dest: str) -> FlowResult:
+    """Push-relabel (Goldberg-Tarjan) en traitant d'abord le sommet actif le plus haut.
+
+    Les sommets en excès poussent leur flot vers des voisins d'une hauteur plus
+    basse, ou sont relevés quand ils ne peuvent plus pousser. Deux heuristiques
+    évitent les relabels inutiles : le gap (une hauteur vide sépare des sommets
+    du puits) et le global relabel (recalcul des hauteurs exactes par BFS inverse).
+    Complexité en O(V² × √E).
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph des capacités
+        source (str): La source
+        dest (str): Le puits
+
+    Returns:
+        FlowResult: Le flot maximum, le flot par arête et la coupe minimale
+    """
+    residual = shared_residual(graph)
+    source_id, dest_id = residual.graph.id_of(source), residual.graph.id_of(dest)
+    return residual.result(_push_relabel(residual, source_id, dest_id), source_id)
+
+
+def _push_relabel(residual: ResidualGraph, source: int, sink: int):
+    """Cœur du push-relabel sur le graph résiduel, renvoie le flot ajouté."""
+    offsets, edges, heads, capacity = residual.offsets, residual.edges, residual.heads, residual.capacity
+    n = residual.vertex_count
+    if source == sink:
+        return 0
+
+    height = [0] * n
+    excess = [0] * n
+    current = list(offsets[:-1])
+    count = [0] * (2 * n + 1)  # nombre de sommets par hauteur, pour le gap
+    buckets: list[list[int]] = [[] for _ in range(2 * n + 1)]
+
+    # Saturation des arêtes sortantes de la source
+    for position in range(offsets[source], offsets[source + 1]):
+        edge = edges[position]
+        flot = capacity[edge]
+        if flot > 0:
+            capacity[edge] = 0
+            capacity[edge ^ 1] += flot
+            excess[heads[edge]] += flot
+            excess[source] -= flot
+
+    def is_active(vertex: int) -> bool:
+        return excess[vertex] > 0 and vertex != source and vertex != sink
+
+    def global_relabel() -> int:
+        """Hauteurs exactes : distance au puits, ou n + distance à la source."""
+        for vertex in range(n):
+            height[vertex] = 2 * n
+        for root, base in ((sink, 0), (source, n)):
+            height[root] = base
+            queue = deque([root])
+            while queue:
+                vertex = queue.popleft()
+                for position in range(offsets[vertex], offsets[vertex + 1]):
+                    edge = edges[position]
+                    neighbor = heads[edge]
+                    if capacity[edge ^ 1] > 0 and height[neighbor] == 2 * n:
+                        height[neighbor] = height[vertex] + 1
+                        queue.append(neighbor)
+
+        for bucket in buckets:
+            bucket.clear()
+        count[:] = [0] * (2 * n + 1)
+        highest = -1
+        for vertex in range(n):
+            count[height[vertex]] += 1
+            current[vertex] = offsets[vertex]
+            if is_active(vertex) and height[vertex] < 2 * n:
+                buckets[height[vertex]].append(vertex)
+                highest = max(highest, height[vertex])
+        return highest
+
+    highest = global_relabel()
+    relabels = 0
+    pushes = total_relabels = global_relabels = 0
+    while highest >= 0:
+        bucket = buckets[highest]
+        if not bucket:
+            highest -= 1
+            continue
+        vertex = bucket.pop()
+        if height[vertex] != highest or not is_active(vertex):
+            continue
+
+        # Décharge du sommet
+        while excess[vertex] > 0:
+            position = current[vertex]
+            if position == offsets[vertex + 1]:
+                old = height[vertex]
+                new = 2 * n
+                for position in range(offsets[vertex], offsets[vertex + 1]):
+                    edge = edges[position]
+                    if capacity[edge] > 0 and height[heads[edge]] + 1 < new:
+                        new = height[heads[edge]] + 1
+                count[old] -= 1
+                height[vertex] = new
+                count[new] += 1
+                current[vertex] = offsets[vertex]
+                relabels += 1
+                total_relabels += 1
+
+                if old < n and count[old] == 0:
+                    # Gap : les sommets au-dessus de old ne peuvent plus atteindre le puits
+                    for other in range(n):
+                        if old < height[other] < n:
+                            count[height[other]] -= 1
+                            height[other] = n + 1
+                            count[n + 1] += 1
+                            current[other] = offsets[other]
+                            if is_active(other):
+                                buckets[n + 1].append(other)
+                                highest = max(highest, n + 1)
+                if height[vertex] >= 2 * n:
+                    break
+                continue
+
+            edge = edges[position]
+            neighbor = heads[edge]
+            if capacity[edge] > 0 and height[vertex] == height[neighbor] + 1:
+                flot = min(excess[vertex], capacity[edge])
+                capacity[edge] -= flot
+                capacity[edge ^ 1] += flot
+                if excess[neighbor] == 0 and neighbor != source and neighbor != sink:
+                    buckets[height[neighbor]].append(neighbor)
+                    highest = max(highest, height[neighbor])
+                excess[vertex] -= flot
+                excess[neighbor] += flot
+                pushes += 1
+            else:
+                current[vertex] += 1
+
+        if relabels >= n:
+            relabels = 0
+            highest = global_relabel()
+            global_relabels += 1
+
+    record(pushes=pushes, relabels=total_relabels, global_relabels=global_relabels)
+    return excess[sink]
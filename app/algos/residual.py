@@ -0,0 +1,156 @@
+"""Graphe résiduel à base de tableaux partagé par les algorithmes de flot."""
+
+from array import array
+from typing import NamedTuple
+
+from app.algos.graph import CSRGraph, as_csr
+
+
+class ResidualGraph:
+    """Graphe résiduel construit une seule fois à partir d'un graph CSR.
+
+    Chaque arête (u, v) du graph d'origine donne une arête directe de capacité
+    c(u, v) et une arête inverse de capacité 0, stockées côte à côte : l'arête
+    inverse de e est toujours e ^ 1. Les arêtes sont regroupées par sommet de
+    départ au format CSR (offsets / edges), le graph d'origine n'est jamais modifié.
+
+    Attributes:
+        graph (CSRGraph): Le graph d'origine.
+        offsets (array): V + 1 bornes des listes d'arêtes résiduelles.
+        edges (array): Identifiants d'arêtes résiduelles regroupés par sommet de départ.
+        heads (array): Sommet d'arrivée de chaque arête résiduelle.
+        capacity (array): Capacité résiduelle courante de chaque arête.
+    """
+
+    __slots__ = ("graph", "offsets", "edges", "heads", "capacity")
+
+    def __init__(self, graph: CSRGraph | dict[str, dict[str, int]]) -> None:
+        graph = as_csr(graph)
+        self.graph = graph
+        vertex_count = graph.vertex_count
+        sources = graph.edge_sources()
+
+        self.heads = array("i")
+        self.capacity = array(graph.weight_typecode)
+        degree = [0] * (vertex_count + 1)
+        for tail, head, capacity in zip(sources, graph.targets, graph.weights):
+            self.heads.append(head)
+            self.heads.append(tail)
+            self.capacity.append(capacity)
+            self.capacity.append(0)
+            degree[tail + 1] += 1
+            degree[head + 1] += 1
+
+        self.offsets = array("q", degree)
+        for vertex in range(vertex_count):
+            self.offsets[vertex + 1] += self.offsets[vertex]
+
+        # Tri par dénombrement des arêtes résiduelles selon leur sommet de départ
+        position = list(self.offsets[:-1])
+        self.edges = array("i", bytes(4 * len(self.heads)))
+        for edge in range(len(self.heads)):
+            tail = self.heads[edge ^ 1]
+            self.edges[position[tail]] = edge
+            position[tail] += 1
+
+    @property
+    def vertex_count(self) -> int:
+        """Nombre de sommets."""
+        return self.graph.vertex_count
+
+    def reset(self) -> None:
+        """Remet le flot à zéro pour réutiliser la structure sur une autre requête."""
+        weights = array(self.graph.weight_typecode, self.graph.weights)
+        self.capacity[0::2] = weights
+        self.capacity[1::2] = array(weights.typecode, bytes(weights.itemsize * len(weights)))
+
+    def augment(self, path: list[int], limit=None):
+        """Pousse le flot maximal possible le long d'un chemin d'arêtes résiduelles.
+
+        Args:
+            path (list[int]): Les arêtes résiduelles du chemin.
+            limit (optional): Flot maximum à pousser. Defaults to None (pas de limite).
+
+        Returns:
+            Le flot poussé (capacité minimale du chemin, bornée par limit).
+        """
+        capacity = self.capacity
+        flot_courant = min(capacity[edge] for edge in path)
+        if limit is not None:
+            flot_courant = min(flot_courant, limit)
+        for edge in path:
+            capacity[edge] -= flot_courant
+            capacity[edge ^ 1] += flot_courant
+        return flot_courant
+
+    def path_to(self, parent_edge: list[int], source: int, sink: int) -> list[int]:
+        """Reconstruit la liste des arêtes d'un chemin depuis la table des arêtes parentes."""
+        path = []
+        vertex = sink
+        while vertex != source:
+            edge = parent_edge[vertex]
+            path.append(edge)
+            vertex = self.heads[edge ^ 1]
+        path.reverse()
+        return path
+
+    def reachable(self, source: int) -> bytearray:
+        """Sommets atteignables depuis source par des arêtes non saturées."""
+        offsets, edges, heads, capacity = self.offsets, self.edges, self.heads, self.capacity
+        seen = bytearray(self.vertex_count)
+        seen[source] = 1
+        stack = [source]
+        while stack:
+            vertex = stack.pop()
+            for position in range(offsets[vertex], offsets[vertex + 1]):
+                edge = edges[position]
+                if capacity[edge] > 0 and not seen[heads[edge]]:
+                    seen[heads[edge]] = 1
+                    stack.append(heads[edge])
+        return seen
+
+    def result(self, value, source: int) -> "FlowResult":
+        """Construit le résultat : valeur, flot par arête d'origine et coupe minimale."""
+        names = self.graph.names
+        flows: dict[str, dict[str, int]] = {name: {} for name in names}
+        # Le flot d'une arête d'origine est la capacité de son arête inverse
+        for edge in range(0, len(self.heads), 2):
+            flows[names[self.heads[edge ^ 1]]][names[self.heads[edge]]] = self.capacity[edge ^ 1]
+
+        seen = self.reachable(source)
+        source_side = [name for vertex, name in enumerate(names) if seen[vertex]]
+        sink_side = [name for vertex, name in enumerate(names) if not seen[vertex]]
+        return FlowResult(value, flows, (source_side, sink_side))
+
+
+def shared_residual(graph: CSRGraph | dict[str, dict[str, int]]) -> ResidualGraph:
+    """Graphe résiduel gardé par le graph et remis à zéro, pour enchaîner les requêtes.
+
+    La structure (offsets, edges, heads) est construite une seule fois par graph ;
+    chaque appel ne fait que recopier les capacités. Un seul calcul à la fois
+    doit l'utiliser.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph des capacités
+
+    Returns:
+        ResidualGraph: Le graph résiduel, sans flot
+    """
+    graph = as_csr(graph)
+    residual = graph.derived("residual", lambda: ResidualGraph(graph))
+    residual.reset()
+    return residual
+
+
+class FlowResult(NamedTuple):
+    """Résultat d'un calcul de flot maximum.
+
+    Attributes:
+        value: La valeur du flot maximum.
+        flows (dict[str, dict[str, int]]): Le flot sur chaque arête d'origine, au format de source.json.
+        cut (tuple[list[str], list[str]]): La coupe minimale (côté source, côté puits).
+    """
+
+    value: float
+    flows: dict[str, dict[str, int]]
+    cut: tuple[list[str], list[str]]
@@ -0,0 +1,111 @@
+from collections import deque
+
+from app.algos.bellman_ford import BellmanFordResult
+from app.algos.graph import CSRGraph, as_csr
+from app.utils.counters import record
+
+
+def spfa(graph: CSRGraph | dict[str, dict[str, int]], start: str) -> BellmanFordResult:
+    """SPFA (Shortest Path Faster Algorithm) : Bellman Ford piloté par une file.
+
+    Seuls les sommets dont la distance vient de changer sont remis dans la file,
+    avec les heuristiques SLF (Small Label First : un sommet plus proche que la
+    tête de file passe devant) et LLL (Large Label Last : une tête de file plus
+    loin que la moyenne est renvoyée en queue).
+
+    Un cycle négatif est détecté quand un plus court chemin atteint V arêtes,
+    il est alors extrait du graph des prédécesseurs.
+
+    Args:
+        graph (CSRGraph | dict[str, dict[str, int]]): Le graph
+        start (str): Le sommet de départ
+
+    Returns:
+        BellmanFordResult: Les distances et les sommets d'un cycle négatif
+            accessible depuis start (liste vide si aucun).
+    """
+    graph = as_csr(graph)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    vertex_count = graph.vertex_count
+    source = graph.id_of(start)
+
+    distances = [float("inf")] * vertex_count
+    parents = [-1] * vertex_count
+    lengths = [0] * vertex_count  # nombre d'arêtes du chemin courant
+    in_queue = [False] * vertex_count
+    distances[source] = 0
+
+    queue = deque([source])
+    in_queue[source] = True
+    queued_sum = 0  # somme des distances des sommets en file, pour LLL
+    pops = relaxations = 0
+
+    while queue:
+        # LLL : on renvoie en queue les têtes plus loin que la moyenne
+        average = queued_sum / len(queue)
+        for _ in range(len(queue) - 1):
+            if distances[queue[0]] <= average:
+                break
+            queue.rotate(-1)
+        vertex = queue.popleft()
+        in_queue[vertex] = False
+        queued_sum -= distances[vertex]
+        pops += 1
+
+        for edge in range(offsets[vertex], offsets[vertex + 1]):
+            neighbor = targets[edge]
+            current_weight = distances[vertex] + weights[edge]
+            if current_weight >= distances[neighbor]:
+                continue
+
+            if in_queue[neighbor]:
+                queued_sum += current_weight - distances[neighbor]
+            distances[neighbor] = current_weight
+            parents[neighbor] = vertex
+            lengths[neighbor] = lengths[vertex] + 1
+            relaxations += 1
+
+            if lengths[neighbor] >= vertex_count and (cycle := _parent_cycle(parents)):
+                record(queue_pops=pops, relaxations=relaxations)
+                return BellmanFordResult(_named(graph, distances), [graph.names[node] for node in cycle])
+
+            if not in_queue[neighbor]:
+                in_queue[neighbor] = True
+                queued_sum += current_weight
+                # SLF : un sommet plus proche que la tête de file passe devant
+                if queue and current_weight < distances[queue[0]]:
+                    queue.appendleft(neighbor)
+                else:
+                    queue.append(neighbor)
+
+    record(queue_pops=pops, relaxations=relaxations)
+    return BellmanFordResult(_named(graph, distances), [])
+
+
+def _parent_cycle(parents: list[int]) -> list[int]:
+    """Cherche un cycle dans le graph des prédécesseurs (chaque sommet a au plus un parent).
+
+    Returns:
+        list[int]: Les sommets du cycle dans le sens des arêtes, ou une liste vide.
+    """
+    # 0 : non visité, 1 : sur la remontée courante, 2 : déjà traité
+    state = [0] * len(parents)
+    for root in range(len(parents)):
+        walk = []
+        vertex = root
+        while vertex != -1 and state[vertex] == 0:
+            state[vertex] = 1
+            walk.append(vertex)
+            vertex = parents[vertex]
+        if vertex != -1 and state[vertex] == 1:
+            cycle = walk[walk.index(vertex):]
+            cycle.reverse()
+            return cycle
+        for node in walk:
+            state[node] = 2
+    return []
+
+
+def _named(graph: CSRGraph, distances: list[float]) -> dict[str, float]:
+    """Indexe les distances par nom de sommet."""
+    return dict(zip(graph.names, distances))
@@ -0,0 +1,8 @@
+"""Benchmark suite: synthetic graph generators and a repeatable timing runner.
+
+The constants below are used by the command line parser, which imports this
+package without loading the generators or the runner.
+"""
+
+DEFAULT_SIZES = (100, 1000, 10000)
+GENERATOR_NAMES = ("erdos-renyi", "grid", "scale-free", "layered-flow")
@@ -0,0 +1,140 @@
+"""Synthetic graph generators for benchmarks.
+
+Every generator is deterministic for a given seed, builds the CSR graph
+directly (no nested dict) and returns a Workload: the graph plus a start and
+an end vertex for point-to-point and flow algorithms. Vertices are named
+"0" .. "n-1"; weights are positive integers so every algorithm applies.
+"""
+
+import math
+import random
+from typing import Callable, Dict, NamedTuple
+
+from app.algos.graph import CSRBuilder, CSRGraph
+from app.benchmark import GENERATOR_NAMES
+
+MAX_WEIGHT = 100
+
+
+class Workload(NamedTuple):
+    """A generated graph and the query endpoints used to benchmark it."""
+
+    name: str
+    graph: CSRGraph
+    start: str
+    end: str
+
+
+def _build(name: str, size: int, edges: list[set[int]], rng: random.Random, start: int, end: int) -> Workload:
+    builder = CSRBuilder()
+    for vertex in range(size):
+        builder.add_vertex(str(vertex))
+    for tail, heads in enumerate(edges):
+        for head in sorted(heads):
+            builder.add_edge(str(tail), str(head), rng.randint(1, MAX_WEIGHT))
+    return Workload(name, builder.build(), str(start), str(end))
+
+
+def erdos_renyi(size: int, seed: int = 0, average_degree: float = 4.0) -> Workload:
+    """Directed G(n, p) random graph with p chosen for the given average out-degree.
+
+    Edges are drawn with geometric skips, in O(V + E) instead of O(V²).
+    """
+    rng = random.Random(seed)
+    edges: list[set[int]] = [set() for _ in range(size)]
+    probability = min(1.0, average_degree / max(size - 1, 1))
+    if probability >= 1.0:
+        for tail in range(size):
+            edges[tail].update(head for head in range(size) if head != tail)
+    elif probability > 0:
+        # Walk the size * (size - 1) candidate edges, skipping a geometric number each time
+        log_q = math.log(1.0 - probability)
+        candidate = -1
+        total = size * (size - 1)
+        while True:
+            candidate += 1 + int(math.log(1.0 - rng.random()) / log_q)
+            if candidate >= total:
+                break
+            tail, offset = divmod(candidate, size - 1)
+            edges[tail].add(offset + (offset >= tail))
+    return _build("erdos-renyi", size, edges, rng, 0, size - 1)
+
+
+def grid(size: int, seed: int = 0) -> Workload:
+    """Square grid with edges in both directions between 4-neighbours.
+
+    The side is rounded so the grid has about size vertices; the query goes
+    from one corner to the opposite one.
+    """
+    rng = random.Random(seed)
+    side = max(1, math.isqrt(size))
+    count = side * side
+    edges: list[set[int]] = [set() for _ in range(count)]
+    for row in range(side):
+        for column in range(side):
+            vertex = row * side + column
+            if column + 1 < side:
+                edges[vertex].add(vertex + 1)
+                edges[vertex + 1].add(vertex)
+            if row + 1 < side:
+                edges[vertex].add(vertex + side)
+                edges[vertex + side].add(vertex)
+    return _build("grid", count, edges, rng, 0, count - 1)
+
+
+def scale_free(size: int, seed: int = 0, attachments: int = 2) -> Workload:
+    """Barabási-Albert preferential attachment graph, edges in both directions.
+
+    Each new vertex links to `attachments` existing vertices chosen with a
+    probability proportional to their degree, giving a power-law degree tail.
+    """
+    rng = random.Random(seed)
+    edges: list[set[int]] = [set() for _ in range(size)]
+    # Each vertex appears once per incident edge: sampling it is degree-proportional
+    endpoints: list[int] = []
+    seed_count = min(size, attachments + 1)
+    for tail in range(seed_count):
+        for head in range(tail + 1, seed_count):
+            edges[tail].add(head)
+            edges[head].add(tail)
+            endpoints += (tail, head)
+    for vertex in range(seed_count, size):
+        chosen: set[int] = set()
+        while len(chosen) < min(attachments, vertex):
+            chosen.add(rng.choice(endpoints) if endpoints else rng.randrange(vertex))
+        for head in chosen:
+            edges[vertex].add(head)
+            edges[head].add(vertex)
+            endpoints += (vertex, head)
+    return _build("scale-free", size, edges, rng, 0, size - 1)
+
+
+def layered_flow(size: int, seed: int = 0, fan_out: int = 3) -> Workload:
+    """Layered flow network between a source and a sink.
+
+    The inner vertices are split into about sqrt(size) layers; each vertex
+    links to fan_out vertices of the next layer, the source feeds the whole
+    first layer and the last layer drains into the sink.
+    """
+    rng = random.Random(seed)
+    inner = max(size - 2, 1)
+    width = max(1, math.isqrt(inner))
+    layers = [list(range(1 + first, 1 + min(first + width, inner))) for first in range(0, inner, width)]
+    sink = inner + 1
+    edges: list[set[int]] = [set() for _ in range(inner + 2)]
+    edges[0].update(layers[0])
+    for layer, following in zip(layers, layers[1:]):
+        for vertex in layer:
+            edges[vertex].update(rng.sample(following, min(fan_out, len(following))))
+    for vertex in layers[-1]:
+        edges[vertex].add(sink)
+    return _build("layered-flow", inner + 2, edges, rng, 0, sink)
+
+
+GENERATORS: Dict[str, Callable[..., Workload]] = {
+    "erdos-renyi": erdos_renyi,
+    "grid": grid,
+    "scale-free": scale_free,
+    "layered-flow": layered_flow,
+}
+assert tuple(GENERATORS) == GENERATOR_NAMES, "GENERATOR_NAMES must list the generators"
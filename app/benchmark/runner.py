@@ -0,0 +1,239 @@
+"""Benchmark runner: repeated perf_counter_ns samples of every graph algorithm.
+
+Each algorithm registered in AlgorithmType with a "graph" parameter is run on
+each generated workload, after warmup runs, with the garbage collector paused
+during each sample. Results give median / p95 / throughput per run and, across
+sizes, scaling curves with their empirical log-log exponent.
+"""
+
+import csv
+import gc
+import json
+import math
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple
+
+from app.benchmark import DEFAULT_SIZES
+from app.benchmark.generators import GENERATORS, Workload
+from app.exercises import AlgorithmType, ExerciseManager
+from app.utils.logging.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class BenchmarkResult(NamedTuple):
+    """Timing summary of one algorithm on one workload."""
+
+    algorithm: str
+    generator: str
+    size: int
+    vertices: int
+    edges: int
+    runs: int
+    median_ms: float
+    p95_ms: float
+    mean_ms: float
+    min_ms: float
+    throughput: float  # runs per second, from the median
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Percentile with linear interpolation between the closest ranks."""
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * fraction
+    low = math.floor(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def time_call(function: Callable[..., Any], args: List[Any]) -> int:
+    """Run function(*args) once with the garbage collector paused, in nanoseconds."""
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        function(*args)
+        return time.perf_counter_ns() - start
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def sample(function: Callable[..., Any], args: List[Any], repeat: int = 5, warmup: int = 1,
+           max_time: float | None = None) -> List[float]:
+    """Collect up to `repeat` timings in milliseconds after `warmup` untimed runs.
+
+    Sampling stops early once max_time seconds have been spent, keeping at
+    least one sample.
+    """
+    for _ in range(warmup):
+        function(*args)
+    samples: List[float] = []
+    budget_ns = None if max_time is None else max_time * 1e9
+    spent = 0
+    while len(samples) < repeat:
+        elapsed = time_call(function, args)
+        samples.append(elapsed / 1e6)
+        spent += elapsed
+        if budget_ns is not None and spent >= budget_ns:
+            break
+    return samples
+
+
+def benchmarkable() -> List[AlgorithmType]:
+    """Algorithms taking a graph and having an implementation."""
+    return [
+        algo_type for algo_type in ExerciseManager.get_all_algorithms()
+        if "graph" in algo_type.value.parameters and ExerciseManager.is_algorithm_available(algo_type)
+    ]
+
+
+def run_benchmarks(
+    algorithms: Iterable[str] | None = None,
+    generators: Iterable[str] | None = None,
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    repeat: int = 5,
+    warmup: int = 1,
+    seed: int = 0,
+    max_time: float | None = 1.0,
+    params: Dict[str, Any] | None = None,
+) -> List[BenchmarkResult]:
+    """Benchmark algorithms over generated workloads of increasing size.
+
+    Args:
+        algorithms: Commands to run (every benchmarkable algorithm if None).
+        generators: Generator names from GENERATORS (all if None).
+        sizes: Requested vertex counts.
+        repeat: Maximum number of timed samples per algorithm and workload.
+        warmup: Untimed runs before sampling.
+        seed: Seed of the graph generators.
+        max_time: Seconds allowed per algorithm and workload; an algorithm
+            exceeding it is not run on larger sizes of the same generator.
+        params: Extra data keys (e.g. "delta", "workers") passed to the
+            algorithms declaring them as parameters.
+
+    Raises:
+        ValueError: If an algorithm is unknown or does not take a graph.
+
+    Returns:
+        One BenchmarkResult per algorithm and workload actually run.
+
+    """
+    algo_types = benchmarkable()
+    if algorithms is not None:
+        wanted = set(algorithms)
+        if unknown := wanted - {algo_type.value.command for algo_type in algo_types}:
+            raise ValueError(f"Algorithmes non mesurables: {', '.join(sorted(unknown))}")
+        algo_types = [algo_type for algo_type in algo_types if algo_type.value.command in wanted]
+    generator_names = list(GENERATORS) if generators is None else list(generators)
+
+    results: List[BenchmarkResult] = []
+    for generator_name in generator_names:
+        too_slow: set[str] = set()
+        for size in sorted(sizes):
+            workload = GENERATORS[generator_name](size, seed=seed)
+            logger.debug(f"Generated {generator_name} ({size}): {workload.graph}")
+            for algo_type in algo_types:
+                command = algo_type.value.command
+                if command in too_slow:
+                    continue
+                try:
+                    result = _benchmark(algo_type, workload, size, repeat, warmup, max_time, params or {})
+                except Exception as e:  # e.g. a negative cycle: skip, keep benchmarking
+                    logger.warning(f"{command} on {generator_name} ({size}) failed: {e}")
+                    continue
+                results.append(result)
+                if max_time is not None and _spent_ms(result) >= max_time * 1000:
+                    logger.debug(f"{command} reached the time budget on {generator_name} ({size})")
+                    too_slow.add(command)
+    return results
+
+
+def _spent_ms(result: BenchmarkResult) -> float:
+    return result.mean_ms * result.runs
+
+
+def _benchmark(algo_type: AlgorithmType, workload: Workload, size: int, repeat: int, warmup: int,
+               max_time: float | None, params: Dict[str, Any]) -> BenchmarkResult:
+    info = algo_type.value
+    data: Dict[str, Any] = dict(params, graph=workload.graph, matrice_start=workload.start, matrice_end=workload.end)
+    function = ExerciseManager.get_algorithm_function(algo_type)
+    args = ExerciseManager._prepare_parameters(info.parameters, data)
+    samples = sample(function, args, repeat, warmup, max_time)
+    median = percentile(samples, 0.5)
+    return BenchmarkResult(
+        algorithm=info.command,
+        generator=workload.name,
+        size=size,
+        vertices=workload.graph.vertex_count,
+        edges=workload.graph.edge_count,
+        runs=len(samples),
+        median_ms=median,
+        p95_ms=percentile(samples, 0.95),
+        mean_ms=sum(samples) / len(samples),
+        min_ms=min(samples),
+        throughput=1000 / median if median > 0 else math.inf,
+    )
+
+
+def scaling_curves(results: Iterable[BenchmarkResult]) -> List[Dict[str, Any]]:
+    """Median time against graph size for each algorithm and generator.
+
+    The exponent is the least-squares slope of log(median) over log(V + E),
+    e.g. about 1 for a linear algorithm, about 3 for Floyd-Warshall.
+    """
+    curves: Dict[tuple[str, str], List[BenchmarkResult]] = {}
+    for result in results:
+        curves.setdefault((result.algorithm, result.generator), []).append(result)
+
+    scaling = []
+    for (algorithm, generator), points in curves.items():
+        points.sort(key=lambda result: result.vertices)
+        scaling.append({
+            "algorithm": algorithm,
+            "generator": generator,
+            "points": [
+                {"vertices": point.vertices, "edges": point.edges, "median_ms": point.median_ms}
+                for point in points
+            ],
+            "exponent": _log_log_slope(
+                [point.vertices + point.edges for point in points],
+                [point.median_ms for point in points],
+            ),
+        })
+    return scaling
+
+
+def _log_log_slope(sizes: List[int], times: List[float]) -> float | None:
+    pairs = [(math.log(size), math.log(time_ms)) for size, time_ms in zip(sizes, times) if size > 0 and time_ms > 0]
+    if len({x for x, _ in pairs}) < 2:
+        return None
+    mean_x = sum(x for x, _ in pairs) / len(pairs)
+    mean_y = sum(y for _, y in pairs) / len(pairs)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in pairs)
+    variance = sum((x - mean_x) ** 2 for x, _ in pairs)
+    return covariance / variance
+
+
+def to_document(results: List[BenchmarkResult]) -> Dict[str, Any]:
+    """The results and their scaling curves, as a JSON-compatible document."""
+    return {
+        "results": [result._asdict() for result in results],
+        "scaling": scaling_curves(results),
+    }
+
+
+def write_json(results: List[BenchmarkResult], path: str | Path) -> None:
+    """Write the results and their scaling curves as a JSON document."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(to_document(results), f, indent=2)
+
+
+def write_csv(results: List[BenchmarkResult], path: str | Path) -> None:
+    """Write one CSV row per result."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=BenchmarkResult._fields)
+        writer.writeheader()
+        for result in results:
+            writer.writerow(result._asdict())
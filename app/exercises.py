@@ -3,6 +3,8 @@
 from enum import Enum
 from typing import Any, Callable, Dict, List, NamedTuple, Tuple
 
+from app.utils.exec_time import ExecutionMetrics, mesurer_temps_execution
+
 
 class AlgorithmInfo(NamedTuple):
     """Algorithm information container."""
@@ -27,7 +29,7 @@ class AlgorithmType(Enum):
         exercise="Implémenter un parcours DFS et afficher l'ordre de visite des sommets",
         category="Parcours de Graphes",
         function=lambda: __import__("app.algos.dfs", fromlist=["run"]).run,
-        parameters=("matrices", "matrice_start"),
+        parameters=("graph", "matrice_start"),
     )
 
     DFS_CYCLE = AlgorithmInfo(
@@ -37,7 +39,7 @@ class AlgorithmType(Enum):
         exercise="Utiliser DFS pour détecter la présence de cycles dans un graphe orienté",
         category="Parcours de Graphes",
         function=lambda: __import__("app.algos.dfs", fromlist=["run_cyles"]).run_cyles,
-        parameters=("matrices", "matrice_start"),
+        parameters=("graph", "matrice_start"),
     )
 
     BFS = AlgorithmInfo(
@@ -47,17 +49,17 @@ class AlgorithmType(Enum):
         exercise="Implémenter un parcours BFS et calculer les distances depuis un sommet source",
         category="Parcours de Graphes",
         function=lambda: __import__("app.algos.bfs", fromlist=["run"]).run,
-        parameters=("matrices", "matrice_start"),
+        parameters=("graph", "matrice_start"),
     )
 
     BFS_CONNEXE = AlgorithmInfo(
         name="BFS Composantes Connexes",
         command="bfs-connexe",
-        description="Trouver les composantes connexes avec BFS",
+        description="Trouver les composantes connexes (union-find)",
         exercise="Utiliser BFS pour identifier toutes les composantes connexes d'un graphe",
         category="Parcours de Graphes",
         function=lambda: __import__("app.algos.bfs", fromlist=["run_find_connexe"]).run_find_connexe,
-        parameters=("matrices",),
+        parameters=("graph",),
     )
 
     DIJKSTRA = AlgorithmInfo(
@@ -67,7 +69,77 @@ class AlgorithmType(Enum):
         exercise="Calculer les plus courts chemins depuis un sommet source (poids ≥ 0)",
         category="Plus Courts Chemins",
         function=lambda: __import__("app.algos.dijkstra", fromlist=["dijkstra"]).dijkstra,
-        parameters=("matrices", "matrice_start"),
+        parameters=("graph", "matrice_start"),
+    )
+
+    DIJKSTRA_HEAP = AlgorithmInfo(
+        name="Dijkstra (tas binaire)",
+        command="dijkstra-heap",
+        description="Dijkstra avec tas binaire, même pour des poids entiers bornés",
+        exercise="Comparer le tas binaire à la file à seaux choisie par dijkstra pour les petits poids entiers",
+        category="Plus Courts Chemins",
+        function=lambda: __import__("app.algos.dijkstra", fromlist=["heap_dijkstra"]).heap_dijkstra,
+        parameters=("graph", "matrice_start"),
+    )
+
+    DELTA_STEPPING = AlgorithmInfo(
+        name="Delta-Stepping",
+        command="delta-stepping",
+        description="Plus courts chemins depuis une source par seaux de largeur delta, relâchés par lots",
+        exercise="Relâcher les arêtes légères de chaque seau en un lot, éventuellement sur plusieurs processus",
+        category="Plus Courts Chemins",
+        function=lambda: __import__("app.algos.delta_stepping", fromlist=["delta_stepping"]).delta_stepping,
+        parameters=("graph", "matrice_start", "delta", "workers"),
+    )
+
+    DIJKSTRA_PATH = AlgorithmInfo(
+        name="Dijkstra Point à Point",
+        command="dijkstra-path",
+        description="Plus court chemin entre deux sommets avec arrêt anticipé",
+        exercise="Arrêter Dijkstra dès que le sommet d'arrivée est fixé et reconstruire le chemin",
+        category="Plus Courts Chemins",
+        function=lambda: __import__("app.algos.dijkstra", fromlist=["dijkstra_path"]).dijkstra_path,
+        parameters=("graph", "matrice_start", "matrice_end"),
+    )
+
+    DIJKSTRA_BIDIRECTIONAL = AlgorithmInfo(
+        name="Dijkstra Bidirectionnel",
+        command="dijkstra-bi",
+        description="Plus court chemin point à point cherché depuis les deux extrémités",
+        exercise="Avancer depuis le départ et reculer depuis l'arrivée jusqu'à la rencontre des deux recherches",
+        category="Plus Courts Chemins",
+        function=lambda: __import__("app.algos.dijkstra", fromlist=["bidirectional_dijkstra"]).bidirectional_dijkstra,
+        parameters=("graph", "matrice_start", "matrice_end"),
+    )
+
+    ASTAR = AlgorithmInfo(
+        name="A*",
+        command="astar",
+        description="Recherche point à point guidée par une heuristique (nulle par défaut)",
+        exercise="Ordonner la file de Dijkstra par g + h pour se diriger vers le sommet d'arrivée",
+        category="Plus Courts Chemins",
+        function=lambda: __import__("app.algos.astar", fromlist=["astar"]).astar,
+        parameters=("graph", "matrice_start", "matrice_end"),
+    )
+
+    ALT = AlgorithmInfo(
+        name="ALT (A* + Repères)",
+        command="alt",
+        description="A* avec bornes de l'inégalité triangulaire sur des sommets repères",
+        exercise="Précalculer les distances de quelques repères pour guider A* sur les grands graphes",
+        category="Plus Courts Chemins",
+        function=lambda: __import__("app.algos.astar", fromlist=["alt"]).alt,
+        parameters=("graph", "matrice_start", "matrice_end"),
+    )
+
+    CONTRACTION_HIERARCHY = AlgorithmInfo(
+        name="Hiérarchies de Contraction",
+        command="ch",
+        description="Requêtes point à point sur une hiérarchie de raccourcis précalculée",
+        exercise="Contracter les sommets par différence d'arêtes puis chercher uniquement vers le haut de la hiérarchie",
+        category="Plus Courts Chemins",
+        function=lambda: __import__("app.algos.contraction", fromlist=["contraction_hierarchy"]).contraction_hierarchy,
+        parameters=("graph", "matrice_start", "matrice_end"),
     )
 
     BELLMAN_FORD = AlgorithmInfo(
@@ -77,7 +149,7 @@ class AlgorithmType(Enum):
         exercise="Calculer les plus courts chemins même avec des arêtes de poids négatif",
         category="Plus Courts Chemins",
         function=lambda: __import__("app.algos.bellman_ford", fromlist=["bellman_ford"]).bellman_ford,
-        parameters=("matrices", "matrice_start"),
+        parameters=("graph", "matrice_start"),
     )
 
     BELLMAN_FORD_NEG = AlgorithmInfo(
@@ -87,7 +159,37 @@ class AlgorithmType(Enum):
         exercise="Détecter les cycles de poids négatif dans un graphe pondéré",
         category="Plus Courts Chemins",
         function=lambda: __import__("app.algos.bellman_ford", fromlist=["bellman_ford_contains_neg"]).bellman_ford_contains_neg,
-        parameters=("matrice_start", "matrices"),  # Note: different order for this function
+        parameters=("matrice_start", "graph"),  # Note: different order for this function
+    )
+
+    BELLMAN_FORD_CYCLE = AlgorithmInfo(
+        name="Bellman-Ford + Témoin de Cycle",
+        command="bf-cycle",
+        description="Distances et cycle négatif en un seul appel",
+        exercise="Arrêter Bellman-Ford dès qu'une passe est stable et renvoyer un cycle négatif concret",
+        category="Plus Courts Chemins",
+        function=lambda: __import__("app.algos.bellman_ford", fromlist=["bellman_ford_cycle"]).bellman_ford_cycle,
+        parameters=("graph", "matrice_start"),
+    )
+
+    SPFA = AlgorithmInfo(
+        name="SPFA (SLF + LLL)",
+        command="spfa",
+        description="Bellman-Ford piloté par file, ne relâche que les sommets modifiés",
+        exercise="Plus courts chemins avec poids négatifs et détection de cycles sur graphes creux",
+        category="Plus Courts Chemins",
+        function=lambda: __import__("app.algos.spfa", fromlist=["spfa"]).spfa,
+        parameters=("graph", "matrice_start"),
+    )
+
+    ALL_PAIRS = AlgorithmInfo(
+        name="Plus Courts Chemins Toutes Paires",
+        command="apsp",
+        description="Index des distances entre toutes les paires (Floyd-Warshall / Johnson)",
+        exercise="Précalculer toutes les distances une fois pour répondre à chaque requête en O(1)",
+        category="Plus Courts Chemins",
+        function=lambda: __import__("app.algos.all_pairs", fromlist=["all_pairs"]).all_pairs,
+        parameters=("graph",),
     )
 
     # Flow Algorithms (matrice, matrice_start, matrice_end)
@@ -98,7 +200,7 @@ class AlgorithmType(Enum):
         exercise="Trouver le flot maximum entre une source et un puits",
         category="Flots Maximum",
         function=lambda: __import__("app.algos.ff", fromlist=["ford_fulkerson"]).ford_fulkerson,
-        parameters=("matrices", "matrice_start", "matrice_end"),
+        parameters=("graph", "matrice_start", "matrice_end"),
     )
 
     EDMONDS_KARP = AlgorithmInfo(
@@ -108,7 +210,27 @@ class AlgorithmType(Enum):
         exercise="Version optimisée de Ford-Fulkerson utilisant BFS pour les chemins augmentants",
         category="Flots Maximum",
         function=lambda: __import__("app.algos.ek", fromlist=["edmonds_karp"]).edmonds_karp,
-        parameters=("matrices", "matrice_start", "matrice_end"),
+        parameters=("graph", "matrice_start", "matrice_end"),
+    )
+
+    DINIC = AlgorithmInfo(
+        name="Dinic",
+        command="dinic",
+        description="Flot maximum par graphe de niveaux et flot bloquant",
+        exercise="Calculer le flot maximum en saturant un flot bloquant à chaque phase",
+        category="Flots Maximum",
+        function=lambda: __import__("app.algos.dinic", fromlist=["dinic"]).dinic,
+        parameters=("graph", "matrice_start", "matrice_end"),
+    )
+
+    PUSH_RELABEL = AlgorithmInfo(
+        name="Push-Relabel",
+        command="push-relabel",
+        description="Flot maximum par préflot (plus haut label, gap, global relabel)",
+        exercise="Calculer le flot maximum avec l'algorithme de Goldberg-Tarjan",
+        category="Flots Maximum",
+        function=lambda: __import__("app.algos.push_relabel", fromlist=["push_relabel"]).push_relabel,
+        parameters=("graph", "matrice_start", "matrice_end"),
     )
 
     # List Algorithms (list)
@@ -245,10 +367,24 @@ class ExerciseManager:
         return ExerciseManager.get_algorithm_function(algo_type) is not None
 
     @staticmethod
-    def execute_algorithm(algo_type: AlgorithmType, data: Dict[str, Any]) -> Tuple[Any, float]:
-        """Execute an algorithm with appropriate parameters."""
-        from app.utils.exec_time import mesurer_temps_execution
-
+    def execute_algorithm(
+        algo_type: AlgorithmType,
+        data: Dict[str, Any],
+        cache: Any = None,
+        track_memory: bool = False,
+    ) -> Tuple[Any, ExecutionMetrics]:
+        """Execute an algorithm with appropriate parameters.
+
+        Args:
+            algo_type: Algorithm to execute.
+            data: Loaded data (graph, start/end vertices, ...).
+            cache: Optional ResultCache serving repeated identical queries.
+            track_memory: Also measure the peak memory (slows the execution down).
+
+        Returns:
+            Tuple of (result, ExecutionMetrics).
+
+        """
         info = algo_type.value
         algorithm_func = ExerciseManager.get_algorithm_function(algo_type)
 
@@ -257,13 +393,76 @@ class ExerciseManager:
 
         # Check if it's a placeholder function (returns a string)
         if isinstance(algorithm_func, str) or (hasattr(algorithm_func, '__name__') and algorithm_func.__name__ == "_placeholder_function"):
-            return algorithm_func, 0.0
+            return algorithm_func, ExecutionMetrics(0.0, 0.0, None, {})
 
         # Prepare parameters
         args = ExerciseManager._prepare_parameters(info.parameters, data)
 
-        # Execute with timing
-        return mesurer_temps_execution(algorithm_func, *args)
+        if cache is None:
+            # Execute with timing
+            return mesurer_temps_execution(algorithm_func, *args, memoire=track_memory)
+
+        key = ExerciseManager.cache_key(algo_type, data)
+        (found, result), lookup = mesurer_temps_execution(cache.get, key)
+        if found:
+            return result, lookup._replace(cached=True)
+        result, metrics = mesurer_temps_execution(algorithm_func, *args, memoire=track_memory)
+        cache.put(key, result)
+        return result, metrics
+
+    @staticmethod
+    def execute_many(
+        algo_type: AlgorithmType,
+        data: Dict[str, Any],
+        queries: List[Dict[str, Any]],
+        workers: int | None = None,
+    ) -> List[Tuple[Any, ExecutionMetrics]]:
+        """Execute an algorithm for many start/end vertices on a process pool.
+
+        Args:
+            algo_type: Algorithm to execute.
+            data: Loaded data; the graph is shared with the workers, not pickled.
+            queries: Objects with optional "start" / "end" keys.
+            workers: Number of worker processes (os.cpu_count() if None).
+
+        Returns:
+            List of (result, ExecutionMetrics), in query order.
+
+        """
+        from app.utils.parallel import ParallelExecutor
+
+        with ParallelExecutor(data, workers) as executor:
+            return executor.execute_many(algo_type, queries)
+
+    @staticmethod
+    def cache_key(algo_type: AlgorithmType, data: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Build the result cache key: (command, parameters, graph fingerprint)."""
+        info = algo_type.value
+        values = [
+            repr(data.get(param_name))
+            for param_name in info.parameters
+            if param_name not in ("graph", "matrices")
+        ]
+        fingerprint = ""
+        if "graph" in data or "matrices" in data:
+            fingerprint = ExerciseManager._get_graph(data).fingerprint()
+        return info.command, "|".join(values), fingerprint
+
+    @staticmethod
+    def _get_graph(data: Dict[str, Any]) -> Any:
+        """Return the compact CSR graph, building it from the matrices if needed."""
+        if "graph" not in data:
+            from app.algos.graph import CSRGraph
+
+            data["graph"] = CSRGraph.from_dict(data["matrices"])
+        return data["graph"]
+
+    @staticmethod
+    def _get_matrices(data: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+        """Return the adjacency dict, rebuilding it from a streamed graph if needed."""
+        if "matrices" not in data:
+            data["matrices"] = data["graph"].to_dict()
+        return data["matrices"]
 
     @staticmethod
     def _prepare_parameters(param_names: tuple[str, ...], data: Dict[str, Any]) -> List[Any]:
@@ -273,7 +472,9 @@ class ExerciseManager:
         for param_name in param_names:
             match param_name:
                 case "matrices":
-                    args.append(data["matrices"])
+                    args.append(ExerciseManager._get_matrices(data))
+                case "graph":
+                    args.append(ExerciseManager._get_graph(data))
                 case "matrice_start":
                     args.append(data["matrice_start"])
                 case "matrice_end":
@@ -1,16 +1,122 @@
 """Entry point for the algorithm toolbox application."""
 
+import json
 import logging
 import sys
+from contextlib import ExitStack
+from typing import Any
 
-from rich.console import Console
-
+from app.utils.batch import read_queries, run_batch
 from app.utils.interactivity.launcher import AlgorithmLauncher
-from app.utils.interactivity.menu import AlgorithmMenu, display_welcome
 from app.utils.interactivity.parser import parse_args
-from app.utils.logging.logging_config import get_logger, setup_logging
-
-console = Console()
+from app.utils.logging.logging_config import get_console, get_logger, setup_logging
+
+
+def run_batch_mode(
+    launcher: AlgorithmLauncher,
+    queries_path: str,
+    output_path: str | None,
+    workers: int | None = None,
+    track_memory: bool = False,
+) -> None:
+    """Run every query of a JSON lines file against the loaded graph."""
+    queries_file = sys.stdin if queries_path == "-" else open(queries_path, encoding="utf-8")
+    output = sys.stdout if output_path is None else open(output_path, "w", encoding="utf-8")
+    try:
+        run_batch(
+            launcher.data,
+            read_queries(queries_file),
+            output,
+            cache=launcher.cache,
+            workers=workers,
+            track_memory=track_memory,
+        )
+    finally:
+        if queries_file is not sys.stdin:
+            queries_file.close()
+        if output is not sys.stdout:
+            output.close()
+
+
+def profiling(args: Any) -> ExitStack:
+    """Build the profilers requested on the command line around an execution."""
+    stack = ExitStack()
+    if args.profile or args.profile_output:
+        from app.utils.profiling import profiled
+
+        stack.enter_context(profiled(output=args.profile_output))
+    if args.profile_sample:
+        from app.utils.profiling import sampled
+
+        stack.enter_context(sampled(args.profile_sample, interval=args.sample_interval / 1000))
+    return stack
+
+
+def print_result(command: str, result: Any, metrics: Any, full: bool) -> None:
+    """Write a result as JSON on standard output, for scripts.
+
+    Args:
+        command: Algorithm command.
+        result: Algorithm execution result.
+        metrics: Execution measurements.
+        full: Write the whole record (like batch mode) instead of the result alone.
+
+    """
+    from app.utils.serialize import to_jsonable
+
+    document = to_jsonable(result)
+    if full:
+        document = {
+            "algorithm": command,
+            "result": document,
+            "time_ms": metrics.wall_ms,
+            "metrics": metrics._asdict(),
+        }
+    print(json.dumps(document, ensure_ascii=False))
+
+
+def run_bench_mode(args: Any) -> None:
+    """Run the benchmark suite and print or write its results."""
+    from app.benchmark.runner import run_benchmarks, to_document, write_csv, write_json
+
+    results = run_benchmarks(
+        algorithms=args.algorithms,
+        generators=args.generators,
+        sizes=args.sizes,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        seed=args.seed,
+        max_time=args.max_time,
+        params={key: value for key, value in (("delta", args.delta), ("workers", args.workers)) if value is not None},
+    )
+    if args.output:
+        if args.output.endswith(".csv"):
+            write_csv(results, args.output)
+        else:
+            write_json(results, args.output)
+        if not args.quiet:
+            get_console().print(f"[green]📊 {len(results)} mesures écrites: {args.output}[/green]")
+        return
+    if args.json or args.quiet:
+        print(json.dumps(to_document(results)))
+        return
+
+    from rich.table import Table
+
+    table = Table(title="Benchmark")
+    for column in ("Algorithme", "Graphe", "V", "E", "Médiane (ms)", "p95 (ms)", "Débit (/s)"):
+        table.add_column(column, justify="left" if column in ("Algorithme", "Graphe") else "right")
+    for result in results:
+        table.add_row(
+            result.algorithm,
+            result.generator,
+            str(result.vertices),
+            str(result.edges),
+            f"{result.median_ms:.3f}",
+            f"{result.p95_ms:.3f}",
+            f"{result.throughput:.1f}",
+        )
+    get_console().print(table)
 
 
 def main() -> None:
@@ -18,21 +124,62 @@ def main() -> None:
     # Parse command line arguments
     args = parse_args()
 
+    # Scripted runs skip everything that needs rich
+    slim = args.quiet or args.json
+
     # Setup logging with debug level if requested
     log_level = logging.DEBUG if args.debug else logging.INFO
-    setup_logging(level=log_level)
+    setup_logging(level=log_level, pretty=not slim)
 
     logger = get_logger(__name__)
     logger.debug("Starting Algorithm Toolbox application")
 
     if args.debug:
         logger.debug("Debug mode enabled")
-        console.print("[dim]🐛 Mode debug activé[/dim]")
+        if not slim:
+            get_console().print("[dim]🐛 Mode debug activé[/dim]")
 
     try:
+        if args.mode == "bench":
+            run_bench_mode(args)
+            logger.debug("Benchmark completed successfully")
+            return
+
         # Initialize launcher
-        launcher = AlgorithmLauncher()
+        launcher = AlgorithmLauncher(args.data, quiet=slim)
         launcher.load_data()
+        if args.start is not None:
+            launcher.data["matrice_start"] = args.start
+        if args.end is not None:
+            launcher.data["matrice_end"] = args.end
+
+        if args.save_snapshot:
+            launcher.save_snapshot(args.save_snapshot)
+            if not slim:
+                get_console().print(f"[green]💾 Instantané écrit: {args.save_snapshot}[/green]")
+            if args.mode is None:
+                sys.exit(0)
+
+        if args.hierarchy:
+            path = launcher.load_hierarchy()
+            logger.debug(f"Contraction hierarchy ready: {path}")
+
+        if args.mode == "batch":
+            with profiling(args):
+                run_batch_mode(launcher, args.queries, args.output, args.workers, args.memory)
+            logger.debug("Batch mode completed successfully")
+            return
+
+        if slim:
+            if args.mode is None:
+                raise ValueError("--quiet / --json demandent un algorithme (pas de mode interactif)")
+            with profiling(args):
+                result, metrics = launcher.execute_algorithm(args.mode, track_memory=args.memory)
+            print_result(args.mode, result, metrics, full=args.json)
+            logger.debug("Application completed successfully")
+            return
+
+        from app.utils.interactivity.menu import AlgorithmMenu, display_welcome
 
         display_welcome()
 
@@ -52,22 +199,28 @@ def main() -> None:
             logger.debug(f"Direct execution mode for algorithm: {algorithm}")
 
         # Execute the selected algorithm
-        result, exec_time = launcher.execute_algorithm(algorithm, debug=args.debug)
+        with profiling(args):
+            result, metrics = launcher.execute_algorithm(algorithm, debug=args.debug, track_memory=args.memory)
 
         # Display results
-        launcher.display_results(result, exec_time, algorithm)
+        launcher.display_results(result, metrics, algorithm)
 
         logger.debug("Application completed successfully")
 
     except KeyboardInterrupt:
-        console.print("\n[yellow]⚠️  Interruption utilisateur[/yellow]")
+        if not slim:
+            get_console().print("\n[yellow]⚠️  Interruption utilisateur[/yellow]")
         logger.debug("Application interrupted by user")
         sys.exit(1)
     except Exception as e:
-        console.print(f"\n[red]❌ Erreur: {e}[/red]")
+        if not slim:
+            get_console().print(f"\n[red]❌ Erreur: {e}[/red]")
         logger.error(f"Application error: {e}")
         if args.debug:
-            console.print_exception()
+            if slim:
+                logger.exception(e)
+            else:
+                get_console().print_exception()
         sys.exit(1)
 
 
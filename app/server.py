@@ -0,0 +1,351 @@
+"""Long-running query server: graphs stay loaded between requests.
+
+The protocol is JSON lines over TCP or a Unix socket, with the same queries as
+batch mode ({"id": ..., "algorithm": ..., "start": ..., "end": ...}) plus an
+optional "data" key selecting another graph file under the directory of the
+default one. Replies are written as soon
+as each query completes and carry back its "id". Control requests use "op":
+"ping", "stats" and "reload".
+
+    python -m app.server --socket /tmp/algo.sock --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import signal
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict
+
+from app.utils.batch import execute_query
+from app.utils.interactivity.launcher import AlgorithmLauncher
+from app.utils.interactivity.parser import int_at_least
+from app.utils.logging.logging_config import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+# Longest accepted request line, in bytes
+MAX_LINE = 1 << 20
+
+
+class LoadedGraph:
+    """A graph kept in memory by the server, with the executor running its queries.
+
+    Queries run either on a ParallelExecutor (graph in shared memory, one
+    process per worker) or, with no workers, one at a time on a thread so the
+    launcher's result cache is never accessed concurrently.
+
+    A thread cannot be interrupted: a query that times out while running keeps
+    the only thread of the graph until it finishes. Until then new queries on
+    that graph are refused instead of queueing behind it and timing out too.
+    """
+
+    def __init__(self, data_file: str, workers: int) -> None:
+        self.launcher = AlgorithmLauncher(data_file)
+        self.launcher.load_data()
+        self.executor: Any = None
+        self.thread = None
+        # Timed out query still running on the thread
+        self.stuck: Future | None = None
+        if workers > 0:
+            from app.utils.parallel import ParallelExecutor
+
+            self.executor = ParallelExecutor(self.launcher.data, workers)
+        else:
+            self.thread = ThreadPoolExecutor(max_workers=1)
+
+    @property
+    def busy(self) -> bool:
+        """True while a timed out query still holds the thread."""
+        return self.stuck is not None and not self.stuck.done()
+
+    async def run(self, query: Dict[str, Any], timeout: float | None) -> Dict[str, Any]:
+        """Run a query and return its result record.
+
+        Raises:
+            RuntimeError: If a timed out query still holds the thread.
+            asyncio.TimeoutError: If the query takes more than timeout seconds.
+
+        """
+        if self.executor is not None:
+            return await asyncio.wait_for(asyncio.wrap_future(self.executor.submit_query(query)), timeout)
+        if self.busy:
+            raise RuntimeError("Graphe occupé par une requête hors délai encore en cours")
+        launcher = self.launcher
+        job = self.thread.submit(execute_query, launcher.data, query, launcher.cache)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(job), timeout)
+        except asyncio.TimeoutError:
+            # A queued query is simply dropped, a running one keeps the thread
+            if not job.cancel():
+                self.stuck = job
+            raise
+
+    def close(self, cancel: bool = True) -> None:
+        """Stop the workers and release the shared graph.
+
+        Args:
+            cancel: Drop the queries still queued instead of running them first.
+
+        """
+        if self.executor is not None:
+            self.executor.close()
+        if self.thread is not None:
+            # Waiting for a stuck query would block the caller until it ends
+            self.thread.shutdown(wait=not self.busy, cancel_futures=cancel)
+
+
+class QueryServer:
+    """Asyncio server answering algorithm queries on preloaded graphs.
+
+    Backpressure: at most max_pending queries are in flight over all
+    connections. Once the limit is reached the server stops reading requests,
+    so clients are slowed down by the socket buffers instead of queueing
+    unbounded work in memory.
+
+    Timeouts: a query not answered within timeout seconds gets an error reply.
+    A query already running cannot be interrupted and keeps its worker busy
+    until it finishes. With workers the other processes keep serving the
+    graph; without workers the graph refuses queries until the thread is
+    free again, so use workers for untrusted or unbounded queries.
+
+    Graph files: a "data" key may only name a file under the directory of the
+    default data file, and at most max_graphs graphs stay loaded; the least
+    recently used one is released to make room for another.
+    """
+
+    def __init__(
+        self,
+        data_file: str = "source.json",
+        workers: int = 0,
+        timeout: float | None = 30.0,
+        max_pending: int = 64,
+        max_graphs: int = 4,
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            data_file: Graph file used by queries without a "data" key.
+            workers: Worker processes per graph (0 runs queries on a thread).
+            timeout: Seconds allowed per query (None for no limit).
+            max_pending: Maximum number of queries in flight.
+            max_graphs: Maximum number of graphs kept loaded.
+
+        """
+        self.data_file = data_file
+        self.data_root = Path(data_file).resolve().parent
+        self.max_graphs = max(max_graphs, 1)
+        self.workers = workers
+        self.timeout = timeout
+        self.pending = asyncio.Semaphore(max_pending)
+        self.graphs: OrderedDict[str, LoadedGraph] = OrderedDict()
+        self.loading: Dict[str, asyncio.Lock] = {}
+        self.served = 0
+        self.failed = 0
+
+    def resolve(self, data_file: str) -> str:
+        """Absolute path of a data file, relative paths being taken from the data directory.
+
+        Raises:
+            ValueError: If the file is outside the directory of the default data file.
+
+        """
+        path = (self.data_root / data_file).resolve()
+        if not path.is_relative_to(self.data_root):
+            raise ValueError(f"Fichier hors du répertoire des données: {data_file}")
+        return str(path)
+
+    async def graph(self, data_file: str) -> LoadedGraph:
+        """Return a loaded graph, loading it off the event loop on first use."""
+        key = self.resolve(data_file)
+        lock = self.loading.setdefault(key, asyncio.Lock())
+        async with lock:
+            if key not in self.graphs:
+                logger.info(f"Loading {key}")
+                try:
+                    self.graphs[key] = await asyncio.to_thread(LoadedGraph, key, self.workers)
+                except BaseException:
+                    # No lock left behind for a file that could not be loaded
+                    if self.loading.get(key) is lock:
+                        del self.loading[key]
+                    raise
+                await self.evict()
+            self.graphs.move_to_end(key)
+            return self.graphs[key]
+
+    async def evict(self) -> None:
+        """Release the least recently used graphs beyond max_graphs."""
+        while len(self.graphs) > self.max_graphs:
+            key, old = self.graphs.popitem(last=False)
+            self.loading.pop(key, None)
+            logger.info(f"Releasing {key}")
+            # Queries already queued on the evicted graph still complete
+            await asyncio.to_thread(old.close, False)
+
+    async def reload(self, data_file: str) -> LoadedGraph:
+        """Drop a loaded graph and load its file again."""
+        key = self.resolve(data_file)
+        async with self.loading.setdefault(key, asyncio.Lock()):
+            old = self.graphs.pop(key, None)
+        if old is not None:
+            await asyncio.to_thread(old.close)
+        return await self.graph(data_file)
+
+    async def handle_query(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one request, never raising."""
+        record = {key: query[key] for key in ("id", "op", "algorithm", "start", "end") if key in query}
+        data_file = query.get("data", self.data_file)
+        if "error" in query:
+            record["error"] = query["error"]
+            query = {"op": "invalid"}
+        try:
+            match query.get("op"):
+                case "invalid":
+                    pass
+                case None:
+                    loaded = await self.graph(data_file)
+                    try:
+                        record = await loaded.run(query, self.timeout)
+                    except asyncio.TimeoutError:
+                        record["error"] = f"Délai dépassé ({self.timeout} s)"
+                case "ping":
+                    record["result"] = "pong"
+                case "stats":
+                    record["result"] = {
+                        "served": self.served,
+                        "failed": self.failed,
+                        "graphs": {path: repr(loaded.launcher.data.get("graph")) for path, loaded in self.graphs.items()},
+                        "busy": [path for path, loaded in self.graphs.items() if loaded.busy],
+                    }
+                case "reload":
+                    loaded = await self.reload(data_file)
+                    record["result"] = repr(loaded.launcher.data.get("graph"))
+                case op:
+                    record["error"] = f"Opération inconnue: {op}"
+        except Exception as e:  # a failing request must not stop the server
+            logger.debug(f"Request {query} failed: {e}")
+            record["error"] = f"{type(e).__name__}: {e}"
+
+        self.served += 1
+        if "error" in record:
+            self.failed += 1
+        return record
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Read JSON lines requests from one client and reply as they complete."""
+        peer = writer.get_extra_info("peername") or "unix socket"
+        logger.debug(f"Client connected: {peer}")
+        write_lock = asyncio.Lock()
+        tasks: set[asyncio.Task] = set()
+
+        async def reply(query: Dict[str, Any]) -> None:
+            try:
+                record = await self.handle_query(query)
+                async with write_lock:
+                    writer.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+                    await writer.drain()
+            except ConnectionError:
+                pass
+            finally:
+                self.pending.release()
+
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                try:
+                    query = json.loads(line)
+                    if not isinstance(query, dict):
+                        raise ValueError("la requête doit être un objet JSON")
+                except ValueError as e:
+                    query = {"error": f"JSON invalide ({e})"}
+                # Stop reading while the server is saturated
+                await self.pending.acquire()
+                task = asyncio.create_task(reply(query))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError) as e:
+            logger.debug(f"Client {peer} dropped: {e}")
+        finally:
+            writer.close()
+            logger.debug(f"Client disconnected: {peer}")
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, socket_path: str | None = None) -> None:
+        """Load the default graph and serve until cancelled."""
+        await self.graph(self.data_file)
+        if socket_path is not None:
+            server = await asyncio.start_unix_server(self.handle_connection, path=socket_path, limit=MAX_LINE)
+            address = socket_path
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE)
+            address = f"{host}:{port}"
+        logger.info(f"Serving queries on {address} (workers={self.workers}, timeout={self.timeout})")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release every loaded graph."""
+        for loaded in self.graphs.values():
+            loaded.close()
+        self.graphs.clear()
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the server argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Serveur de requêtes : les graphes restent chargés entre les requêtes (JSON lines)",
+        prog="python -m app.server",
+    )
+    parser.add_argument("--debug", action="store_true", help="Activer le mode debug avec logs détaillés")
+    parser.add_argument("--data", default="source.json", metavar="FICHIER", help="Graphe chargé par défaut")
+    parser.add_argument("--host", default="127.0.0.1", help="Adresse d'écoute TCP")
+    parser.add_argument("--port", type=int, default=8765, help="Port d'écoute TCP")
+    parser.add_argument("--socket", metavar="CHEMIN", help="Écouter sur une socket Unix au lieu de TCP")
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int_at_least(0),
+        default=0,
+        metavar="N",
+        help="Processus de calcul par graphe (0 : un thread, avec cache de résultats, "
+        "bloqué par une requête hors délai ; préférer N > 0 pour des requêtes non maîtrisées)",
+    )
+    parser.add_argument("--timeout", type=float, default=30.0, help="Délai maximum par requête, en secondes")
+    parser.add_argument("--max-pending", type=int, default=64, metavar="N", help="Requêtes en cours au maximum")
+    parser.add_argument(
+        "--max-graphs",
+        type=int,
+        default=4,
+        metavar="N",
+        help="Graphes gardés chargés au maximum (le moins récemment utilisé est libéré)",
+    )
+    return parser
+
+
+def main() -> None:
+    """Entry point of the query server."""
+    args = create_parser().parse_args()
+    setup_logging(level=logging.DEBUG if args.debug else logging.INFO)
+
+    async def run() -> None:
+        # SIGTERM stops the server like Ctrl+C, releasing the shared graphs
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        server = QueryServer(args.data, args.workers, args.timeout or None, args.max_pending, args.max_graphs)
+        await server.serve(args.host, args.port, args.socket)
+
+    try:
+        asyncio.run(run())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        logger.info("Server stopped")
+
+
+if __name__ == "__main__":
+    main()
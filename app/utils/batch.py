@@ -0,0 +1,115 @@
+"""Batch execution: many queries against one loaded graph, as JSON lines."""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, TextIO
+
+from app.exercises import ExerciseManager
+from app.utils.logging.logging_config import get_logger
+from app.utils.serialize import to_jsonable
+
+logger = get_logger(__name__)
+
+
+def read_queries(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Parse JSON lines queries, skipping blank lines.
+
+    Each query is an object such as {"algorithm": "dijkstra", "start": "A", "end": "F"}.
+    An optional "id" is echoed back in the result, "memory": true also
+    measures the peak memory of the query.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            query = json.loads(line)
+            if not isinstance(query, dict):
+                raise ValueError("la requête doit être un objet JSON")
+        except ValueError as e:
+            query = {"error": f"ligne {line_number}: JSON invalide ({e})"}
+        yield query
+
+
+def query_data(data: Dict[str, Any], query: Dict[str, Any]) -> Dict[str, Any]:
+    """Overlay the start / end vertices of a query on the loaded data."""
+    overlay = dict(data)
+    if "start" in query:
+        overlay["matrice_start"] = query["start"]
+    if "end" in query:
+        overlay["matrice_end"] = query["end"]
+    return overlay
+
+
+def execute_query(data: Dict[str, Any], query: Dict[str, Any], cache: Any = None,
+                  track_memory: bool = False) -> Dict[str, Any]:
+    """Execute one query and build its JSON-compatible result record.
+
+    The record holds the result, its wall time in "time_ms" and the full
+    ExecutionMetrics (CPU time, peak memory, operation counters) in "metrics".
+    """
+    record = {key: query[key] for key in ("id", "algorithm", "start", "end") if key in query}
+    if "error" in query:
+        record["error"] = query["error"]
+        return record
+
+    algo_type = ExerciseManager.get_by_command(query.get("algorithm", ""))
+    if algo_type is None:
+        record["error"] = f"Algorithme non trouvé: {query.get('algorithm')}"
+        return record
+
+    try:
+        result, metrics = ExerciseManager.execute_algorithm(
+            algo_type,
+            query_data(data, query),
+            cache=cache,
+            track_memory=track_memory or bool(query.get("memory")),
+        )
+    except Exception as e:  # a failing query must not stop the batch
+        logger.debug(f"Query {record} failed: {e}")
+        record["error"] = f"{type(e).__name__}: {e}"
+        return record
+
+    record["result"] = to_jsonable(result)
+    record["time_ms"] = metrics.wall_ms
+    record["metrics"] = metrics._asdict()
+    return record
+
+
+def _write_records(output: TextIO, records: Iterable[Dict[str, Any]]) -> int:
+    """Write each record as one JSON line as soon as it is available."""
+    count = 0
+    for record in records:
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        count += 1
+    output.flush()
+    return count
+
+
+def run_batch(data: Dict[str, Any], queries: Iterable[Dict[str, Any]], output: TextIO,
+              cache: Any = None, workers: int | None = None, track_memory: bool = False) -> int:
+    """Execute a stream of queries and write one JSON result per line.
+
+    Args:
+        data: Loaded data, shared by every query.
+        queries: Parsed queries.
+        output: Text stream receiving the JSON lines.
+        cache: Optional ResultCache shared by the queries (sequential mode only).
+        workers: Run the queries on this many processes, results kept in order.
+        track_memory: Measure the peak memory of every query.
+
+    Returns:
+        Number of queries executed.
+
+    """
+    if workers is None:
+        count = _write_records(output, (execute_query(data, query, cache, track_memory) for query in queries))
+    else:
+        from app.utils.parallel import ParallelExecutor
+
+        if track_memory:
+            queries = (dict(query, memory=True) for query in queries)
+        with ParallelExecutor(data, workers) as executor:
+            count = _write_records(output, executor.map_queries(queries))
+
+    logger.debug(f"Batch completed: {count} queries")
+    return count
@@ -0,0 +1,100 @@
+"""LRU result cache for algorithm executions, bounded by a memory budget."""
+
+import sys
+from array import array
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from app.utils.logging.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+def estimate_size(value: Any, _seen: set[int] | None = None) -> int:
+    """Roughly estimate the memory held by a result, following containers."""
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, bytearray, array, int, float)):
+        return size
+    if isinstance(value, dict):
+        return size + sum(
+            estimate_size(key, _seen) + estimate_size(item, _seen) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, _seen) for item in value)
+    if hasattr(value, "__dict__"):
+        return size + estimate_size(vars(value), _seen)
+    return size
+
+
+class ResultCache:
+    """Memoize algorithm results keyed on (command, parameters, graph fingerprint).
+
+    Least recently used entries are evicted once the estimated size of the cached
+    results exceeds the memory budget. Cached results are shared between callers
+    and must not be mutated.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            budget_bytes: Maximum estimated size of all cached results.
+
+        """
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Look up a result and mark it as recently used.
+
+        Returns:
+            Tuple of (found, result).
+
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[0]
+
+    def put(self, key: Hashable, result: Any) -> None:
+        """Store a result, evicting least recently used entries to fit the budget."""
+        size = estimate_size(result)
+        if size > self.budget_bytes:
+            logger.debug(f"Result too large to cache ({size} bytes)")
+            return
+        if key in self._entries:
+            self.used_bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (result, size)
+        self.used_bytes += size
+        while self.used_bytes > self.budget_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.used_bytes -= evicted_size
+
+    def invalidate(self, fingerprint: str | None = None) -> None:
+        """Drop cached results for one graph fingerprint, or everything if None."""
+        if fingerprint is None:
+            self._entries.clear()
+            self.used_bytes = 0
+            return
+        for key in [key for key in self._entries if key[-1] == fingerprint]:
+            self.used_bytes -= self._entries.pop(key)[1]
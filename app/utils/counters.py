@@ -0,0 +1,35 @@
+"""Operation counters reported by the algorithms during an instrumented run.
+
+Algorithms count their basic operations (edges relaxed, heap pushes,
+augmenting paths, ...) in local variables and report them once with record().
+Outside of counting(), record() does nothing.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+_active: ContextVar[Counter | None] = ContextVar("counters", default=None)
+
+
+def record(**counts: int) -> None:
+    """Add operation counts to the active counters, if any."""
+    counter = _active.get()
+    if counter is not None:
+        counter.update(counts)
+
+
+@contextmanager
+def counting() -> Iterator[Counter]:
+    """Collect the counts recorded inside the block.
+
+    Nested blocks also add their counts to the enclosing one.
+    """
+    counter: Counter = Counter()
+    token = _active.set(counter)
+    try:
+        yield counter
+    finally:
+        _active.reset(token)
+        record(**counter)
@@ -1,8 +1,59 @@
+"""Instrumentation des exécutions : temps réel, temps CPU, pic mémoire et compteurs."""
+
 import time
+import tracemalloc
+from typing import Any, NamedTuple
+
+from app.utils.counters import counting
+
+
+class ExecutionMetrics(NamedTuple):
+    """Mesures d'une exécution.
+
+    Attributes:
+        wall_ms: Temps réel écoulé (perf_counter_ns), en millisecondes.
+        cpu_ms: Temps CPU du processus (process_time_ns), en millisecondes.
+        peak_memory_kib: Pic d'allocations Python (tracemalloc), None si non mesuré.
+        counters: Compteurs d'opérations déclarés par l'algorithme.
+        cached: Vrai si le résultat vient du cache (les mesures sont celles de la recherche).
+    """
+
+    wall_ms: float
+    cpu_ms: float
+    peak_memory_kib: float | None
+    counters: dict[str, int]
+    cached: bool = False
+
+
+def mesurer_temps_execution(fonction, *args, memoire=False, **kwargs) -> tuple[Any, ExecutionMetrics]:
+    """Exécute fonction(*args, **kwargs) et mesure son exécution.
+
+    Le suivi mémoire (tracemalloc) ralentit fortement le code Python, il n'est
+    donc activé qu'à la demande ; le temps réel mesuré l'inclut.
+    """
+    if memoire:
+        demarre = not tracemalloc.is_tracing()
+        if demarre:
+            tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    with counting() as compteurs:
+        debut_cpu = time.process_time_ns()
+        debut = time.perf_counter_ns()
+        resultat = fonction(*args, **kwargs)
+        fin = time.perf_counter_ns()
+        fin_cpu = time.process_time_ns()
+
+    pic = None
+    if memoire:
+        pic = (tracemalloc.get_traced_memory()[1] - base) / 1024
+        if demarre:
+            tracemalloc.stop()
 
-def mesurer_temps_execution(fonction, *args, **kwargs):
-    debut = time.time()
-    resultat = fonction(*args, **kwargs)
-    fin = time.time()
-    temps_execution = (fin - debut) * 1000  # Convertir en millisecondes
-    return resultat, temps_execution
\ No newline at end of file
+    return resultat, ExecutionMetrics(
+        wall_ms=(fin - debut) / 1e6,  # Convertir en millisecondes
+        cpu_ms=(fin_cpu - debut_cpu) / 1e6,
+        peak_memory_kib=pic,
+        counters=dict(compteurs),
+    )
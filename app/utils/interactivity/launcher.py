@@ -4,55 +4,118 @@ import json
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
+from app.algos.graph import CSRGraph
 from app.exercises import ExerciseManager
-from app.utils.logging.logging_config import get_logger
+from app.utils.cache import ResultCache
+from app.utils.exec_time import ExecutionMetrics
+from app.utils.loader import load_graph
+from app.utils.snapshot import write_snapshot
+from app.utils.logging.logging_config import get_console, get_logger
 
-console = Console()
 logger = get_logger(__name__)
 
 
 class AlgorithmLauncher:
     """Handles algorithm execution with timing and result display."""
 
-    def __init__(self, data_file: str = "source.json") -> None:
+    def __init__(self, data_file: str = "source.json", quiet: bool = False) -> None:
         """Initialize launcher with data file.
         
         Args:
             data_file: Path to JSON data file.
+            quiet: Never use the rich console (no messages, no spinner).
 
         """
         self.data_file = Path(data_file)
+        self.quiet = quiet
         self.data: Dict[str, Any] = {}
+        self.cache = ResultCache()
         logger.debug(f"Launcher initialized with data file: {data_file}")
 
     def load_data(self) -> None:
-        """Load data from JSON file."""
+        """Load data from a JSON document or an edge list (.tsv, .csv, .txt).
+
+        The graph is streamed straight into the compact CSR representation,
+        without building the nested `matrices` dict.
+        """
         try:
-            with open(self.data_file, encoding="utf-8") as f:
-                self.data = json.load(f)
-            logger.debug(f"Data loaded successfully from {self.data_file}")
+            graph, self.data = load_graph(self.data_file)
+            if graph is not None:
+                self.data["graph"] = graph
+            logger.debug(f"Data loaded successfully from {self.data_file}: {graph}")
+            self.cache.invalidate()
         except FileNotFoundError:
             logger.error(f"Data file not found: {self.data_file}")
-            console.print(f"[red]Erreur: Fichier {self.data_file} introuvable[/red]")
+            self._print_error(f"Erreur: Fichier {self.data_file} introuvable")
             raise
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in {self.data_file}: {e}")
-            console.print(f"[red]Erreur JSON dans {self.data_file}: {e}[/red]")
+            self._print_error(f"Erreur JSON dans {self.data_file}: {e}")
             raise
+        except ValueError as e:
+            logger.error(f"Invalid edge list in {self.data_file}: {e}")
+            self._print_error(f"Erreur de format dans {self.data_file}: {e}")
+            raise
+
+    def save_snapshot(self, path: str) -> None:
+        """Write the loaded graph and its start/end vertices to a binary snapshot.
+
+        Args:
+            path: Destination .csrg file.
+
+        """
+        if "graph" not in self.data:
+            raise ValueError("Aucun graphe chargé")
+        meta = {key: value for key, value in self.data.items() if key not in ("graph", "matrices")}
+        write_snapshot(self.data["graph"], path, meta)
+        logger.debug(f"Snapshot written to {path}")
+
+    def load_hierarchy(self, path: str | Path | None = None) -> Path:
+        """Attach the contraction hierarchy of the loaded graph from a .ch file.
+
+        The file is read if it was built for this graph, otherwise the
+        hierarchy is built and written to it.
+
+        Args:
+            path: Hierarchy file (the data file with a .ch suffix if None).
+
+        Returns:
+            The hierarchy file used.
+
+        """
+        if "graph" not in self.data:
+            raise ValueError("Aucun graphe chargé")
+        from app.algos.contraction import hierarchy_file
 
-    def execute_algorithm(self, command: str, debug: bool = False) -> Tuple[Any, float]:
+        path = self.data_file.with_suffix(".ch") if path is None else Path(path)
+        hierarchy_file(self.data["graph"], path)
+        return path
+
+    def update_graph(self, matrices: Dict[str, Dict[str, int]]) -> None:
+        """Replace the loaded graph and drop the cached results of the old one.
+
+        Args:
+            matrices: New adjacency dict, in the source.json format.
+
+        """
+        old_graph = self.data.get("graph")
+        self.data["matrices"] = matrices
+        self.data["graph"] = CSRGraph.from_dict(matrices)
+        if old_graph is not None:
+            self.cache.invalidate(old_graph.fingerprint())
+        logger.debug(f"Graph updated: {self.data['graph']}")
+
+    def execute_algorithm(self, command: str, debug: bool = False,
+                          track_memory: bool = False) -> Tuple[Any, ExecutionMetrics]:
         """Execute the specified algorithm with timing.
         
         Args:
             command: Algorithm command to execute.
             debug: Enable debug mode.
+            track_memory: Also measure the peak memory (slows the execution down).
             
         Returns:
-            Tuple of (result, execution_time_ms).
+            Tuple of (result, ExecutionMetrics).
 
         """
         algo_type = ExerciseManager.get_by_command(command)
@@ -64,6 +127,14 @@ class AlgorithmLauncher:
         if debug:
             logger.debug(f"Executing algorithm '{info.name}' in debug mode")
 
+        if self.quiet:
+            return ExerciseManager.execute_algorithm(
+                algo_type, self.data, cache=self.cache, track_memory=track_memory,
+            )
+
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        console = get_console()
         console.print(f"\n[bold blue]🚀 Lancement: {info.name}[/bold blue]")
         console.print(f"[dim]{info.exercise}[/dim]\n")
 
@@ -76,20 +147,22 @@ class AlgorithmLauncher:
             task = progress.add_task("Exécution en cours...", total=None)
 
             try:
-                result, exec_time = ExerciseManager.execute_algorithm(algo_type, self.data)
+                result, metrics = ExerciseManager.execute_algorithm(
+                    algo_type, self.data, cache=self.cache, track_memory=track_memory,
+                )
                 progress.update(task, description="[green]✓ Terminé![/green]")
-                return result, exec_time
+                return result, metrics
             except Exception as e:
                 progress.update(task, description="[red]✗ Erreur![/red]")
                 logger.error(f"Algorithm execution failed: {e}")
                 raise
 
-    def display_results(self, result: Any, exec_time: float, command: str) -> None:
+    def display_results(self, result: Any, metrics: ExecutionMetrics, command: str) -> None:
         """Display algorithm results in a formatted way.
         
         Args:
             result: Algorithm execution result.
-            exec_time: Execution time in milliseconds.
+            metrics: Execution measurements (times, memory, operation counters).
             command: Algorithm command for display.
 
         """
@@ -102,16 +175,41 @@ class AlgorithmLauncher:
 
         # Create results panel
         result_text = self._format_result(result)
-        time_text = f"[green]⏱️  Temps d'exécution: {exec_time:.2f} ms[/green]"
+        panel_content = f"{result_text}\n\n{self._format_metrics(metrics)}"
 
-        panel_content = f"{result_text}\n\n{time_text}"
+        from rich.panel import Panel
 
-        console.print(Panel(
+        get_console().print(Panel(
             panel_content,
             title=f"[bold]Résultats - {title}[/bold]",
             border_style="green",
         ))
 
+    def _print_error(self, message: str) -> None:
+        """Print an error message on the console, unless quiet."""
+        if not self.quiet:
+            get_console().print(f"[red]{message}[/red]")
+
+    def _format_metrics(self, metrics: ExecutionMetrics) -> str:
+        """Format execution measurements for display.
+
+        Args:
+            metrics: Execution measurements.
+
+        Returns:
+            Formatted measurements string.
+
+        """
+        lines = [f"[green]⏱️  Temps d'exécution: {metrics.wall_ms:.2f} ms (CPU {metrics.cpu_ms:.2f} ms)[/green]"]
+        if metrics.cached:
+            lines.append("[dim]Résultat servi par le cache[/dim]")
+        if metrics.peak_memory_kib is not None:
+            lines.append(f"[green]🧠 Pic mémoire: {metrics.peak_memory_kib:.1f} Kio[/green]")
+        if metrics.counters:
+            counters = ", ".join(f"{name}={count}" for name, count in metrics.counters.items())
+            lines.append(f"[dim]Opérations: {counters}[/dim]")
+        return "\n".join(lines)
+
     def _format_result(self, result: Any) -> str:
         """Format result for display.
         
@@ -122,6 +220,12 @@ class AlgorithmLauncher:
             Formatted result string.
 
         """
+        if hasattr(result, "_asdict"):
+            # NamedTuple results (e.g. PathResult) are displayed field by field
+            result = result._asdict()
+        elif hasattr(result, "to_dict"):
+            # Index objects (e.g. DistanceIndex) expose a dict view
+            result = result.to_dict()
         if isinstance(result, dict):
             lines = []
             for key, value in result.items():
@@ -144,9 +248,9 @@ class AlgorithmLauncher:
         """
         try:
             self.load_data()
-            result, exec_time = self.execute_algorithm(command, debug)
-            self.display_results(result, exec_time, command)
+            result, metrics = self.execute_algorithm(command, debug)
+            self.display_results(result, metrics, command)
         except Exception as e:
-            console.print(f"[red]Erreur lors de l'exécution: {e}[/red]")
+            self._print_error(f"Erreur lors de l'exécution: {e}")
             if debug:
                 raise
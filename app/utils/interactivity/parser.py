@@ -1,11 +1,33 @@
 """Command line argument parser for the algorithm toolbox."""
 
 import argparse
-from typing import Any
+from typing import Any, Callable
 
 from app.exercises import ExerciseManager
 
 
+def int_at_least(minimum: int) -> Callable[[str], int]:
+    """Build an argparse type accepting integers greater than or equal to minimum.
+
+    Args:
+        minimum: Smallest accepted value.
+
+    Returns:
+        Conversion function raising ArgumentTypeError on invalid values.
+
+    """
+    def convert(value: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"entier attendu : {value!r}") from None
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"doit être supérieur ou égal à {minimum} : {number}")
+        return number
+
+    return convert
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser.
     
@@ -25,6 +47,82 @@ def create_parser() -> argparse.ArgumentParser:
         help="Activer le mode debug avec logs détaillés",
     )
 
+    # Scripted runs: no banner, no spinner, no rich import
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Sortie minimale : seulement le résultat, en JSON sur une ligne",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Sortie JSON complète (résultat, temps, mesures), sans bannière ni animation",
+    )
+
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Mesurer aussi le pic mémoire (tracemalloc, ralentit l'exécution)",
+    )
+
+    # Profiling of the algorithm execution
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profiler l'exécution avec cProfile (rapport trié par temps cumulé sur la sortie d'erreur)",
+    )
+    parser.add_argument(
+        "--profile-output",
+        metavar="FICHIER",
+        help="Avec --profile, écrire aussi les statistiques brutes (.prof, lisibles par pstats / snakeviz)",
+    )
+    parser.add_argument(
+        "--profile-sample",
+        metavar="FICHIER",
+        help="Échantillonner la pile pendant l'exécution et écrire les piles repliées (entrée de flamegraph)",
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        default=1.0,
+        metavar="MS",
+        help="Intervalle d'échantillonnage de --profile-sample, en millisecondes",
+    )
+
+    # Add data file option
+    parser.add_argument(
+        "--data",
+        default="source.json",
+        metavar="FICHIER",
+        help="Fichier de données: JSON (source.json), liste d'arêtes .tsv/.csv/.txt ou instantané .csrg",
+    )
+
+    parser.add_argument(
+        "--save-snapshot",
+        metavar="FICHIER",
+        help="Écrire le graphe chargé dans un instantané binaire .csrg (chargement par mmap)",
+    )
+
+    parser.add_argument(
+        "--hierarchy",
+        action="store_true",
+        help="Relire la hiérarchie de contraction (ch) depuis le fichier .ch voisin des données, "
+             "ou la construire et l'y écrire",
+    )
+
+    # Override the start / end vertices of the data file
+    parser.add_argument(
+        "--start",
+        metavar="SOMMET",
+        help="Sommet de départ (remplace matrice_start)",
+    )
+    parser.add_argument(
+        "--end",
+        metavar="SOMMET",
+        help="Sommet d'arrivée (remplace matrice_end)",
+    )
+
     # Create subparsers for different algorithms
     subparsers = parser.add_subparsers(
         dest="mode",
@@ -52,6 +150,97 @@ def create_parser() -> argparse.ArgumentParser:
         # if info.needs_end:
         #     algo_parser.add_argument("--end", type=int, help="Sommet d'arrivée")
 
+    # Batch mode: many queries against one loaded graph
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Exécuter un fichier de requêtes JSON lines sur le graphe chargé",
+    )
+    batch_parser.description = (
+        "Charge le graphe une seule fois puis exécute chaque requête "
+        '{"algorithm": ..., "start": ..., "end": ...} du fichier, '
+        "un résultat JSON par ligne."
+    )
+    batch_parser.add_argument(
+        "queries",
+        help="Fichier de requêtes JSON lines ('-' pour l'entrée standard)",
+    )
+    batch_parser.add_argument(
+        "--output",
+        "-o",
+        metavar="FICHIER",
+        help="Fichier de résultats (sortie standard par défaut)",
+    )
+    batch_parser.add_argument(
+        "--workers",
+        "-j",
+        type=int_at_least(1),
+        metavar="N",
+        help="Répartir les requêtes sur N processus (graphe partagé en mémoire)",
+    )
+
+    # Benchmark mode: synthetic graphs, no data file needed
+    from app.benchmark import DEFAULT_SIZES, GENERATOR_NAMES
+
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Mesurer les algorithmes de graphes sur des graphes synthétiques",
+    )
+    bench_parser.description = (
+        "Génère des graphes (Erdős–Rényi, grille, sans échelle, réseau de flot en couches) "
+        "de tailles croissantes et mesure chaque algorithme : médiane, p95, débit et courbes de croissance."
+    )
+    bench_parser.add_argument(
+        "--algorithms",
+        "-a",
+        nargs="+",
+        metavar="COMMANDE",
+        help="Algorithmes à mesurer (tous les algorithmes de graphes par défaut)",
+    )
+    bench_parser.add_argument(
+        "--generators",
+        "-g",
+        nargs="+",
+        choices=list(GENERATOR_NAMES),
+        help="Familles de graphes générés (toutes par défaut)",
+    )
+    bench_parser.add_argument(
+        "--sizes",
+        "-s",
+        nargs="+",
+        type=int,
+        default=list(DEFAULT_SIZES),
+        metavar="N",
+        help="Nombres de sommets des graphes générés",
+    )
+    bench_parser.add_argument("--repeat", "-r", type=int, default=5, help="Nombre de mesures par algorithme")
+    bench_parser.add_argument("--warmup", type=int, default=1, help="Exécutions d'échauffement non mesurées")
+    bench_parser.add_argument("--seed", type=int, default=0, help="Graine des générateurs")
+    bench_parser.add_argument(
+        "--max-time",
+        type=float,
+        default=1.0,
+        metavar="SECONDES",
+        help="Budget par algorithme et graphe ; au-delà, les tailles supérieures sont sautées",
+    )
+    bench_parser.add_argument(
+        "--delta",
+        type=float,
+        metavar="D",
+        help="Largeur des seaux de delta-stepping (poids maximal / degré moyen par défaut)",
+    )
+    bench_parser.add_argument(
+        "--workers",
+        type=int_at_least(1),
+        metavar="N",
+        help="Processus utilisés par delta-stepping pour relâcher les grands lots",
+    )
+    bench_parser.add_argument(
+        "--output",
+        "-o",
+        metavar="FICHIER",
+        help="Écrire les résultats en JSON, ou en CSV si le fichier finit par .csv",
+    )
+
     return parser
 
 
@@ -0,0 +1,217 @@
+"""Streaming graph loaders feeding edges directly into a compact CSR graph."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, TextIO, Tuple
+
+from app.algos.graph import CSRBuilder, CSRGraph
+from app.utils.snapshot import open_snapshot
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+EDGE_LIST_DELIMITERS = {".tsv": "\t", ".csv": ","}
+SNAPSHOT_SUFFIX = ".csrg"
+# Characters that can follow a complete JSON number
+NUMBER_END = ",}] \t\r\n"
+# Column names recognised as a header on the first line of an edge list
+HEADER_NAMES = {"source", "target", "src", "dst", "from", "to", "tail", "head", "u", "v", "node1", "node2"}
+
+
+class _JsonStream:
+    """Minimal incremental JSON reader over a text file read in chunks.
+
+    Only the structural characters of the enclosing objects are scanned by hand.
+    Each member value is decoded on its own with json.JSONDecoder.raw_decode, so
+    at most one vertex adjacency is held in memory at a time.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int) -> None:
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer, dropping what was consumed."""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume char or raise a JSONDecodeError."""
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buffer, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A number cut by the chunk boundary (e.g. at its '.' or 'e') decodes
+                # as a shorter number: it is complete only once a delimiter follows
+                complete = not isinstance(value, (int, float)) or (
+                    end < len(self.buffer) and self.buffer[end] in NUMBER_END
+                )
+                if complete or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def members(self):
+        """Iterate over the keys of an object, leaving the stream on each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name", self.buffer, self.pos)
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self.pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self.buffer, self.pos - 1)
+
+
+def load_json_graph(path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[CSRGraph | None, Dict[str, Any]]:
+    """Stream a source.json-like document into a CSR graph.
+
+    The `matrices` object is parsed one vertex at a time and never materialized
+    as a nested dict. Every other top-level key is decoded normally.
+
+    Args:
+        path: Path to the JSON document.
+        chunk_size: Number of characters read per chunk.
+
+    Returns:
+        Tuple of (graph or None if there is no `matrices` key, other top-level keys).
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+
+    """
+    graph = None
+    data: Dict[str, Any] = {}
+    with open(path, encoding="utf-8") as f:
+        stream = _JsonStream(f, chunk_size)
+        for key in stream.members():
+            if key != "matrices":
+                data[key] = stream.value()
+                continue
+            builder = CSRBuilder()
+            for vertex in stream.members():
+                builder.add_vertex(vertex)
+                for neighbor, weight in stream.value().items():
+                    builder.add_edge(vertex, neighbor, weight)
+            graph = builder.build()
+        if stream.peek():
+            raise json.JSONDecodeError("Extra data", stream.buffer, stream.pos)
+    return graph, data
+
+
+def load_edge_list(path: str | Path, delimiter: str | None = None,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> CSRGraph:
+    """Load a `tail<sep>head[<sep>weight]` edge list, one edge per line.
+
+    Blank lines and lines starting with '#' are skipped. The first remaining
+    line is taken as a header when its weight column is not numeric or its two
+    first columns are usual column names (source / target, from / to, ...).
+    Missing weights default to 1.
+
+    Args:
+        path: Path to the edge list.
+        delimiter: Column separator, inferred from the suffix (.tsv, .csv) if None.
+        chunk_size: Approximate number of characters read per batch of lines.
+
+    Returns:
+        The compact graph.
+
+    Raises:
+        ValueError: If a line has fewer than two columns or an invalid weight.
+
+    """
+    path = Path(path)
+    if delimiter is None:
+        delimiter = EDGE_LIST_DELIMITERS.get(path.suffix.lower())
+
+    builder = CSRBuilder()
+    with open(path, encoding="utf-8") as f:
+        line_number = 0
+        first = True
+        while lines := f.readlines(chunk_size):
+            for line in lines:
+                line_number += 1
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                columns = line.split(delimiter)
+                if len(columns) < 2:
+                    raise ValueError(f"{path}:{line_number}: expected at least 2 columns")
+                tail, head = columns[0].strip(), columns[1].strip()
+                header, first = first, False
+                if header and {tail.lower(), head.lower()} <= HEADER_NAMES:
+                    continue
+                weight: float = 1
+                if len(columns) > 2:
+                    try:
+                        weight = _parse_weight(columns[2])
+                    except ValueError:
+                        if header:
+                            continue
+                        raise ValueError(f"{path}:{line_number}: invalid weight {columns[2]!r}") from None
+                builder.add_edge(tail, head, weight)
+    return builder.build()
+
+
+def _parse_weight(text: str) -> float:
+    """Parse an edge weight, keeping integers as int."""
+    text = text.strip()
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def load_graph(path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[CSRGraph | None, Dict[str, Any]]:
+    """Load a graph file, picking the loader from its suffix.
+
+    Binary snapshots (.csrg) are memory-mapped, JSON documents and edge lists
+    are streamed.
+
+    Returns:
+        Tuple of (graph, other data such as matrice_start / matrice_end).
+
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == SNAPSHOT_SUFFIX:
+        return open_snapshot(path)
+    if suffix in EDGE_LIST_DELIMITERS or suffix == ".txt":
+        return load_edge_list(path, chunk_size=chunk_size), {}
+    return load_json_graph(path, chunk_size=chunk_size)
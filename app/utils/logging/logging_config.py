@@ -1,24 +1,48 @@
 """Provides utilities for setting up logging configurations.
 
 Retrieves logger instances for different parts of the application.
+rich is only imported when the console or the rich handler is first needed,
+so scripted runs (--quiet / --json) never pay its import cost.
 """
 
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.logging import RichHandler
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+_console: Console | None = None
 
-def setup_logging(level: int = logging.INFO) -> None:
-    """Set up logging with Rich handler for prettier output."""
+
+def get_console() -> Console:
+    """Get the shared rich console, created on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+def setup_logging(level: int = logging.INFO, pretty: bool = True) -> None:
+    """Set up logging with Rich handler for prettier output.
+
+    With pretty=False, a plain handler writes to standard error instead.
+    """
+    if pretty:
+        from rich.logging import RichHandler
+
+        handler: logging.Handler = RichHandler(console=get_console(), rich_tracebacks=True)
+        log_format = "%(message)s"
+    else:
+        handler = logging.StreamHandler()
+        log_format = "%(levelname)s %(name)s: %(message)s"
     logging.basicConfig(
         level=level,
-        format="%(message)s",
+        format=log_format,
         datefmt="[%X]",
-        handlers=[RichHandler(console=console, rich_tracebacks=True)],
+        handlers=[handler],
     )
 
 def get_logger(name: str) -> logging.Logger:
@@ -0,0 +1,118 @@
+"""Process-pool execution of independent queries over a graph in shared memory."""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, Iterator, List
+
+from app.exercises import AlgorithmType, ExerciseManager
+from app.utils.batch import execute_query, query_data
+from app.utils.exec_time import ExecutionMetrics
+from app.utils.logging.logging_config import get_logger
+from app.utils.snapshot import from_buffer, snapshot_size, write_into
+
+logger = get_logger(__name__)
+
+# Per-worker state, set once by _init_worker
+_worker_data: Dict[str, Any] = {}
+_worker_memory: shared_memory.SharedMemory | None = None
+
+
+def _init_worker(memory_name: str) -> None:
+    """Attach the shared graph snapshot once per worker process."""
+    global _worker_memory, _worker_data
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+    graph, meta = from_buffer(_worker_memory.buf)
+    _worker_data = dict(meta, graph=graph)
+
+
+def _run_query(query: Dict[str, Any]) -> Dict[str, Any]:
+    return execute_query(_worker_data, query)
+
+
+def _run_algorithm(task: tuple[str, Dict[str, Any]]) -> tuple[Any, ExecutionMetrics]:
+    command, query = task
+    algo_type = ExerciseManager.get_by_command(command)
+    return ExerciseManager.execute_algorithm(algo_type, query_data(_worker_data, query))
+
+
+class ParallelExecutor:
+    """Fan out independent queries over a ProcessPoolExecutor.
+
+    The graph is written once into a shared memory block using the snapshot
+    layout. Each worker maps it with zero-copy views instead of receiving a
+    pickled copy per task. Results are returned in submission order.
+
+    Use as a context manager so the pool and the shared memory are released.
+    """
+
+    def __init__(self, data: Dict[str, Any], workers: int | None = None) -> None:
+        """Copy the graph to shared memory and start the worker pool.
+
+        Args:
+            data: Loaded data; data["graph"] is shared, other scalar keys are
+                stored as snapshot metadata.
+            workers: Number of worker processes (os.cpu_count() if None).
+
+        Raises:
+            ValueError: If workers is lower than 1.
+
+        """
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        graph = ExerciseManager._get_graph(data)
+        meta = {key: value for key, value in data.items() if key not in ("graph", "matrices")}
+        self.memory = shared_memory.SharedMemory(create=True, size=snapshot_size(graph, meta))
+        try:
+            write_into(self.memory.buf, graph, meta)
+            self.pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.memory.name,),
+            )
+        except BaseException:
+            # No pool to own the block: release it now or it outlives the process
+            self.memory.close()
+            self.memory.unlink()
+            raise
+        logger.debug(f"Parallel executor started: {self.memory.size} bytes shared, workers={workers}")
+
+    def map_queries(self, queries: Iterable[Dict[str, Any]], chunksize: int = 1) -> Iterator[Dict[str, Any]]:
+        """Execute batch queries in parallel, yielding result records in order.
+
+        Each record is yielded as soon as it and every earlier one are done, so
+        the caller can write results while later queries are still running.
+        Consume the iterator before closing the executor.
+        """
+        yield from self.pool.map(_run_query, queries, chunksize=chunksize)
+
+    def submit_query(self, query: Dict[str, Any]) -> Future:
+        """Schedule one batch query, returning a future of its result record."""
+        return self.pool.submit(_run_query, query)
+
+    def execute_many(self, algo_type: AlgorithmType, queries: Iterable[Dict[str, Any]],
+                     chunksize: int = 1) -> List[tuple[Any, ExecutionMetrics]]:
+        """Execute one algorithm for many start / end vertices in parallel.
+
+        Args:
+            algo_type: Algorithm to execute.
+            queries: Objects with optional "start" / "end" keys.
+            chunksize: Number of queries sent to a worker at once.
+
+        Returns:
+            List of (result, ExecutionMetrics), in query order.
+
+        """
+        tasks = ((algo_type.value.command, query) for query in queries)
+        return list(self.pool.map(_run_algorithm, tasks, chunksize=chunksize))
+
+    def close(self) -> None:
+        """Stop the workers and release the shared memory."""
+        self.pool.shutdown()
+        self.memory.close()
+        self.memory.unlink()
+
+    def __enter__(self) -> "ParallelExecutor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
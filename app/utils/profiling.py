@@ -0,0 +1,116 @@
+"""Profiling hooks: deterministic cProfile reports and periodic stack sampling."""
+
+import cProfile
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+from typing import Iterator, TextIO
+
+from app.utils.logging.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@contextmanager
+def profiled(
+    stream: TextIO | None = None,
+    sort: str = "cumulative",
+    limit: int = 30,
+    output: str | Path | None = None,
+) -> Iterator[cProfile.Profile]:
+    """Profile the block with cProfile and print a pstats report.
+
+    Args:
+        stream: Where the report is printed (standard error if None).
+        sort: pstats sort key.
+        limit: Number of functions in the report.
+        output: Optional file receiving the raw stats (for snakeviz, pstats, ...).
+
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if output is not None:
+            profiler.dump_stats(output)
+            logger.debug(f"Profile stats written to {output}")
+        stats = pstats.Stats(profiler, stream=stream or sys.stderr)
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+
+
+class StackSampler:
+    """Sample the stack of one thread at a fixed interval from a daemon thread.
+
+    Sampling only reads sys._current_frames(), so the profiled code runs at
+    full speed. The effective resolution is bounded by the interpreter switch
+    interval (sys.getswitchinterval(), 5 ms by default), since the sampler has
+    to take the GIL to read the frames.
+    """
+
+    def __init__(self, thread_id: int | None = None, interval: float = 0.001) -> None:
+        """Initialize the sampler.
+
+        Args:
+            thread_id: Thread to sample (the calling thread if None).
+            interval: Seconds between two samples.
+
+        """
+        self.thread_id = threading.get_ident() if thread_id is None else thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[_collapse(frame)] += 1
+
+    def write_collapsed(self, output: TextIO) -> None:
+        """Write the samples in collapsed-stack format, one "root;...;leaf count" per line.
+
+        This is the input of flamegraph.pl, speedscope or inferno.
+        """
+        for stack, count in self.stacks.most_common():
+            output.write(f"{stack} {count}\n")
+
+
+def _collapse(frame: FrameType | None) -> str:
+    """Render a stack root first, one "function (file:line)" label per frame."""
+    labels = []
+    while frame is not None:
+        code = frame.f_code
+        labels.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+        frame = frame.f_back
+    labels.reverse()
+    return ";".join(labels)
+
+
+@contextmanager
+def sampled(output: str | Path, interval: float = 0.001) -> Iterator[StackSampler]:
+    """Sample the calling thread during the block and write collapsed stacks to output."""
+    sampler = StackSampler(interval=interval)
+    sampler.start()
+    try:
+        yield sampler
+    finally:
+        sampler.stop()
+        with open(output, "w", encoding="utf-8") as f:
+            sampler.write_collapsed(f)
+        logger.debug(f"{sum(sampler.stacks.values())} stack samples written to {output}")
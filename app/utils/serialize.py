@@ -0,0 +1,24 @@
+"""Conversion of algorithm results to JSON-compatible values."""
+
+import math
+from array import array
+from typing import Any
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert an algorithm result to plain JSON types.
+
+    NamedTuples become objects, index objects use their to_dict() view, tuples,
+    sets and arrays become lists, and infinite distances become null.
+    """
+    if hasattr(value, "_asdict"):
+        return {key: to_jsonable(item) for key, item in value._asdict().items()}
+    if hasattr(value, "to_dict"):
+        return to_jsonable(value.to_dict())
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset, array, memoryview)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
@@ -0,0 +1,168 @@
+"""Binary CSR graph snapshots, opened through mmap with zero-copy views.
+
+Layout (little endian, every section aligned on 8 bytes):
+
+    header        magic, version, weight typecode, vertex / edge counts,
+                  name blob size and metadata size
+    offsets       (V + 1) x int64
+    targets       E x int32
+    weights       E x int64 or float64
+    name_offsets  (V + 1) x int64, bounds of each name in the blob
+    names         UTF-8 blob of all vertex names
+    metadata      UTF-8 JSON object (matrice_start, matrice_end, ...)
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from app.algos.graph import CSRGraph
+
+MAGIC = b"CSRG"
+VERSION = 1
+HEADER = struct.Struct("<4sHcxQQQQ")
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def _as_bytes(values: Any) -> memoryview:
+    """Raw little-endian bytes of an array or memoryview, without copying when possible."""
+    if sys.byteorder != "little":
+        values = array(values.typecode if isinstance(values, array) else values.format, values)
+        values.byteswap()
+    return memoryview(values).cast("B")
+
+
+def _sections(graph: CSRGraph, meta: Dict[str, Any]) -> Tuple[bytes, List[memoryview]]:
+    """Build the header and the ordered list of data sections of a snapshot."""
+    encoded = [name.encode("utf-8") for name in graph.names]
+    name_offsets = array("q", [0]) * (len(encoded) + 1)
+    for vertex, name in enumerate(encoded):
+        name_offsets[vertex + 1] = name_offsets[vertex] + len(name)
+    names = b"".join(encoded)
+    metadata = json.dumps(meta).encode("utf-8")
+
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        graph.weight_typecode.encode("ascii"),
+        graph.vertex_count,
+        graph.edge_count,
+        len(names),
+        len(metadata),
+    )
+    sections = [
+        _as_bytes(graph.offsets),
+        _as_bytes(graph.targets),
+        _as_bytes(graph.weights),
+        _as_bytes(name_offsets),
+        memoryview(names),
+        memoryview(metadata),
+    ]
+    return header, sections
+
+
+def snapshot_size(graph: CSRGraph, meta: Dict[str, Any] | None = None) -> int:
+    """Number of bytes needed to hold the snapshot of a graph."""
+    header, sections = _sections(graph, meta or {})
+    return _align(len(header)) + sum(_align(len(section)) for section in sections)
+
+
+def write_into(buffer: Any, graph: CSRGraph, meta: Dict[str, Any] | None = None) -> int:
+    """Write the snapshot into a writable buffer (e.g. shared memory).
+
+    Returns:
+        Number of bytes written.
+
+    """
+    header, sections = _sections(graph, meta or {})
+    view = memoryview(buffer).cast("B")
+    position = len(header)
+    view[:position] = header
+    position = _align(position)
+    for section in sections:
+        view[position:position + len(section)] = section
+        position = _align(position + len(section))
+    return position
+
+
+def write_snapshot(graph: CSRGraph, path: str | Path, meta: Dict[str, Any] | None = None) -> None:
+    """Write a graph snapshot file.
+
+    Args:
+        graph: Graph to save.
+        path: Destination file.
+        meta: Extra JSON-serializable data stored with the graph.
+
+    """
+    header, sections = _sections(graph, meta or {})
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(bytes(_align(len(header)) - len(header)))
+        for section in sections:
+            f.write(section)
+            f.write(bytes(_align(len(section)) - len(section)))
+
+
+def from_buffer(buffer: Any) -> Tuple[CSRGraph, Dict[str, Any]]:
+    """Build a graph whose arrays are zero-copy views over a snapshot buffer.
+
+    The buffer must stay alive as long as the graph is used.
+
+    Raises:
+        ValueError: If the buffer does not hold a supported snapshot.
+
+    """
+    view = memoryview(buffer).cast("B")
+    if len(view) < HEADER.size:
+        raise ValueError("Snapshot too small")
+    magic, version, typecode, vertex_count, edge_count, names_size, meta_size = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Not a graph snapshot")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}")
+    if sys.byteorder != "little":
+        raise ValueError("Memory-mapped snapshots require a little-endian machine")
+
+    position = _align(HEADER.size)
+
+    def take(size: int) -> memoryview:
+        nonlocal position
+        section = view[position:position + size]
+        position = _align(position + size)
+        return section
+
+    weight_format = typecode.decode("ascii")
+    offsets = take(8 * (vertex_count + 1)).cast("q")
+    targets = take(4 * edge_count).cast("i")
+    weights = take(8 * edge_count).cast(weight_format)
+    name_offsets = take(8 * (vertex_count + 1)).cast("q")
+    blob = bytes(take(names_size))
+    meta = json.loads(bytes(take(meta_size)) or b"{}")
+
+    names = [
+        blob[name_offsets[vertex]:name_offsets[vertex + 1]].decode("utf-8")
+        for vertex in range(vertex_count)
+    ]
+    return CSRGraph(names, offsets, targets, weights), meta
+
+
+def open_snapshot(path: str | Path) -> Tuple[CSRGraph, Dict[str, Any]]:
+    """Open a snapshot file through a read-only mmap.
+
+    The offsets, targets and weights arrays are views over the mapped pages,
+    shared by every process opening the same file.
+
+    Returns:
+        Tuple of (graph, stored metadata).
+
+    """
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return from_buffer(mapped)